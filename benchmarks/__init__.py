@@ -0,0 +1,12 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# Planetmint and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""Benchmarks of the transaction lifecycle hot paths.
+
+Run them with ``python -m benchmarks``, see ``python -m benchmarks --help``.
+Every benchmark reports operations per second and the memory allocated per
+operation, and is compared against the stored baseline in
+``benchmarks/baseline.json``.
+"""
@@ -0,0 +1,129 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# Planetmint and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""Reproducible fixtures for the benchmarks.
+
+All keys are derived from fixed seeds and no fixture uses random data, so
+every run benchmarks byte for byte the same transactions.
+"""
+
+from hashlib import sha256
+
+import base58
+
+from transactions.common.crypto import CryptoKeypair, PrivateKey
+from transactions.common.output import Output
+from transactions.common.transaction import Transaction
+from transactions.types.assets.compose import Compose
+from transactions.types.assets.create import Create
+from transactions.types.assets.decompose import Decompose
+from transactions.types.assets.transfer import Transfer
+from transactions.types.elections.chain_migration_election import ChainMigrationElection
+from transactions.types.elections.validator_election import ValidatorElection
+from transactions.types.elections.vote import Vote
+
+CID = "QmaozNR7DZHQK1ZcU9p7QdrshMvXqWK6gpu5rmrkPdT3L4"
+
+
+def key_pair(seed: int) -> CryptoKeypair:
+    """Derives a key pair from `seed`."""
+    private_key = base58.b58encode(sha256("benchmark-{}".format(seed).encode()).digest()).decode()
+    public_key = PrivateKey(private_key).get_verifying_key().encode().decode()
+    return CryptoKeypair(private_key, public_key)
+
+
+ALICE, BOB, CAROL = key_pair(0), key_pair(1), key_pair(2)
+
+
+def owners(threshold: bool) -> list:
+    """The public keys of an Output, a 2-of-3 threshold if `threshold` is
+    set. Signing needs the private keys of :func:`private_keys`.
+    """
+    if threshold:
+        return [ALICE.public_key, BOB.public_key, CAROL.public_key]
+    return [ALICE.public_key]
+
+
+def private_keys(threshold: bool) -> list[str]:
+    if threshold:
+        return [ALICE.private_key, BOB.private_key, CAROL.private_key]
+    return [ALICE.private_key]
+
+
+def _threshold_output(amount: int) -> Output:
+    # NOTE: `Output.generate` only builds n-of-n thresholds
+    output = Output.generate(owners(True), amount)
+    output.fulfillment.threshold = 2
+    return Output(output.fulfillment, output.public_keys, amount)
+
+
+def create(num_outputs: int = 1, threshold: bool = False) -> Create:
+    """A signed `CREATE` Transaction with `num_outputs` Outputs of amount 1."""
+    recipients = [(owners(threshold), 1)] * num_outputs
+    tx = Create.generate([ALICE.public_key], recipients, assets=[{"data": CID}], metadata=CID)
+    if threshold:
+        tx.outputs = [_threshold_output(1) for _ in range(num_outputs)]
+    return tx.sign([ALICE.private_key])
+
+
+def transfer(num_inputs: int = 1, threshold: bool = False, signed: bool = True) -> Transfer:
+    """A `TRANSFER` Transaction spending all Outputs of a :func:`create`
+    Transaction with `num_inputs` Outputs.
+    """
+    spent = create(num_inputs, threshold)
+    tx = Transfer.generate(spent.to_inputs(), [(owners(threshold), num_inputs)], asset_ids=[spent.id])
+    if threshold:
+        tx.outputs = [_threshold_output(num_inputs)]
+    return tx.sign(private_keys(threshold)) if signed else tx
+
+
+def spent_outputs(tx: Transaction) -> list[Output]:
+    """The Outputs the Inputs of a :func:`transfer` Transaction spend."""
+    return [Output(input_.fulfillment, input_.owners_before) for input_ in tx.inputs]
+
+
+def compose() -> Compose:
+    spent = create()
+    tx = Compose.generate(spent.to_inputs(), [([ALICE.public_key], 1)], [spent.id, CID])
+    return tx.sign([ALICE.private_key])
+
+
+def decompose() -> Decompose:
+    spent = create()
+    recipients = [([ALICE.public_key], 1), ([ALICE.public_key], 2)]
+    tx = Decompose.generate(spent.to_inputs(), recipients, [spent.id, CID])
+    return tx.sign([ALICE.private_key])
+
+
+def _election(cls, data: dict):
+    # NOTE: `Election.generate` seeds the election with a random uuid
+    inputs, outputs = Transaction.complete_tx_i_o([ALICE.public_key], [([BOB.public_key], 1)])
+    election = cls(cls.OPERATION, [{"data": {**data, "seed": "benchmark"}}], inputs, outputs)
+    return election.sign([ALICE.private_key])
+
+
+def validator_election() -> ValidatorElection:
+    public_key = {"value": base58.b58decode(BOB.public_key).hex().upper(), "type": "ed25519-base16"}
+    return _election(ValidatorElection, {"public_key": public_key, "power": 10, "node_id": "benchmark"})
+
+
+def chain_migration_election() -> ChainMigrationElection:
+    return _election(ChainMigrationElection, {})
+
+
+def vote() -> Vote:
+    election = validator_election()
+    tx = Vote.generate(election.to_inputs(), [([BOB.public_key], 1)], [election.id])
+    return tx.sign([BOB.private_key])
+
+
+def as_version_2(tx_dict: dict) -> dict:
+    """Converts a version 3.0 Transaction dict with a single asset to
+    version 2.0. The id is not updated.
+    """
+    tx_dict = dict(tx_dict)
+    tx_dict["version"] = "2.0"
+    tx_dict["asset"] = tx_dict.pop("assets")[0]
+    return tx_dict
@@ -0,0 +1,246 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# Planetmint and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""Measures benchmarks with `timeit` and `tracemalloc` and compares them
+against a baseline.
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import sys
+import timeit
+import tracemalloc
+from collections import namedtuple
+from contextlib import contextmanager
+from statistics import median
+from typing import Callable, Optional
+
+from transactions.common.memoize import cache_stats, get_cache
+
+Benchmark = namedtuple("Benchmark", ("name", "setup", "caches"))
+Result = namedtuple("Result", ("name", "ops_per_sec", "peak_bytes", "retained_bytes"))
+Regression = namedtuple("Regression", ("name", "metric", "baseline", "value"))
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+_benchmarks: dict[str, Benchmark] = {}
+
+
+class SkipBenchmark(Exception):
+    """Raised by the setup of a benchmark that can't run here."""
+
+
+def benchmark(name: str, caches: bool = True) -> Callable:
+    """Registers a benchmark.
+
+    The decorated function sets up the benchmark and returns the function
+    to measure, which takes no arguments.
+
+    Args:
+        name (str): The unique name of the benchmark.
+        caches (bool): Whether the memoization caches are enabled while the
+            benchmark is set up and measured.
+    """
+
+    def register(setup: Callable[[], Callable]) -> Callable:
+        if name in _benchmarks:
+            raise ValueError("benchmark {} is already registered".format(name))
+        _benchmarks[name] = Benchmark(name, setup, caches)
+        return setup
+
+    return register
+
+
+def get_benchmarks(patterns: Optional[list[str]] = None) -> list[Benchmark]:
+    """Returns the registered benchmarks matching any of the glob
+    `patterns`, or all benchmarks.
+    """
+    return [
+        benchmark
+        for name, benchmark in _benchmarks.items()
+        if not patterns or any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+    ]
+
+
+@contextmanager
+def _caches(enabled: bool):
+    # NOTE: Every benchmark starts with empty caches
+    states = {}
+    for name in cache_stats():
+        cache = get_cache(name)
+        states[name] = cache.enabled
+        cache.clear()
+        cache.configure(enabled=enabled)
+    try:
+        yield
+    finally:
+        for name, state in states.items():
+            get_cache(name).configure(enabled=state)
+
+
+def _allocations(func: Callable, calls: int) -> tuple[int, int]:
+    """Returns the median peak of memory allocated by a call of `func` and
+    the memory still allocated after a call on average, in bytes.
+    """
+    tracemalloc.start()
+    try:
+        # NOTE: The first traced call allocates e.g. lazily created
+        #       interpreter state, which isn't retained by `func`
+        func()
+        peaks = []
+        start = tracemalloc.get_traced_memory()[0]
+        for _ in range(calls):
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            func()
+            peaks.append(tracemalloc.get_traced_memory()[1] - current)
+        retained = (tracemalloc.get_traced_memory()[0] - start) // calls
+    finally:
+        tracemalloc.stop()
+    return int(median(peaks)), retained
+
+
+def measure(benchmark: Benchmark, min_time: float = 0.2, repeat: int = 5, alloc_calls: int = 5) -> Result:
+    """Measures a benchmark.
+
+    Args:
+        benchmark (:class:`Benchmark`): The benchmark to measure.
+        min_time (float): The minimum time of a single timing run in seconds.
+        repeat (int): The number of timing runs, the fastest one counts.
+        alloc_calls (int): The number of calls traced by `tracemalloc`.
+
+    Returns:
+        :class:`Result`
+
+    Raises:
+        :exc:`SkipBenchmark`: If the benchmark can't run here.
+    """
+    with _caches(benchmark.caches):
+        func = benchmark.setup()
+        # NOTE: The first call fills the caches and is not measured
+        func()
+        timer = timeit.Timer(func)
+        number = 1
+        while timer.timeit(number) < min_time:
+            number *= 2
+        best = min(timer.repeat(repeat=repeat, number=number)) / number
+        peak_bytes, retained_bytes = _allocations(func, alloc_calls)
+    return Result(benchmark.name, 1 / best, peak_bytes, retained_bytes)
+
+
+def compare(results: list[Result], baseline: dict, tolerance: float = 0.2) -> list[Regression]:
+    """Compares results against a baseline.
+
+    A benchmark regressed if its operations per second dropped, or its peak
+    memory per operation grew, by more than `tolerance` relative to the
+    baseline. Benchmarks missing from the baseline are not compared.
+
+    Args:
+        results (:obj:`list` of :class:`Result`): The results to compare.
+        baseline (dict): The baseline, as saved by :func:`to_json`.
+        tolerance (float): The allowed relative change.
+
+    Returns:
+        :obj:`list` of :class:`Regression`
+    """
+    regressions = []
+    for result in results:
+        base = baseline.get("results", {}).get(result.name)
+        if base is None:
+            continue
+        if result.ops_per_sec < base["ops_per_sec"] * (1 - tolerance):
+            regressions.append(Regression(result.name, "ops_per_sec", base["ops_per_sec"], result.ops_per_sec))
+        # NOTE: A few hundred bytes are noise, e.g. from interned strings
+        if result.peak_bytes > max(base["peak_bytes"] * (1 + tolerance), base["peak_bytes"] + 1024):
+            regressions.append(Regression(result.name, "peak_bytes", base["peak_bytes"], result.peak_bytes))
+    return regressions
+
+
+def to_json(results: list[Result]) -> dict:
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {
+            result.name: {
+                "ops_per_sec": round(result.ops_per_sec, 1),
+                "peak_bytes": result.peak_bytes,
+                "retained_bytes": result.retained_bytes,
+            }
+            for result in results
+        },
+    }
+
+
+def _format_change(value: float, base: Optional[float]) -> str:
+    if not base:
+        return ""
+    return "{:+.1%}".format(value / base - 1)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("patterns", nargs="*", help="glob patterns of the benchmarks to run, e.g. 'sign/*'")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds per timing run")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timing runs")
+    parser.add_argument("--baseline", default=BASELINE, help="baseline to compare against")
+    parser.add_argument("--save", metavar="PATH", help="save the results as JSON, e.g. as new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative change")
+    args = parser.parse_args(argv)
+
+    # NOTE: Registers the benchmarks
+    from benchmarks import suite  # noqa: F401
+
+    benchmarks = get_benchmarks(args.patterns)
+    if args.list:
+        print("\n".join(benchmark.name for benchmark in benchmarks))
+        return 0
+
+    try:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+    except FileNotFoundError:
+        baseline = {}
+    base_results = baseline.get("results", {})
+
+    results = []
+    row = "{:<50} {:>12} {:>8} {:>12} {:>8} {:>10}"
+    print(row.format("benchmark", "ops/sec", "change", "peak bytes", "change", "retained"))
+    for benchmark in benchmarks:
+        try:
+            result = measure(benchmark, args.min_time, args.repeat)
+        except SkipBenchmark as exc:
+            print("{:<50} skipped: {}".format(benchmark.name, exc))
+            continue
+        results.append(result)
+        base = base_results.get(result.name, {})
+        print(
+            row.format(
+                result.name,
+                "{:.1f}".format(result.ops_per_sec),
+                _format_change(result.ops_per_sec, base.get("ops_per_sec")),
+                result.peak_bytes,
+                _format_change(result.peak_bytes, base.get("peak_bytes")),
+                result.retained_bytes,
+            )
+        )
+
+    if args.save:
+        with open(args.save, "w") as results_file:
+            json.dump(to_json(results), results_file, indent=2, sort_keys=True)
+            results_file.write("\n")
+
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(
+            "REGRESSION {}: {} {:.1f} -> {:.1f}".format(
+                regression.name, regression.metric, regression.baseline, regression.value
+            ),
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
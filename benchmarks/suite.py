@@ -0,0 +1,168 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# Planetmint and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""The benchmarks of the transaction lifecycle."""
+
+import io
+import os
+import shutil
+import tempfile
+from functools import partial
+from hashlib import sha3_256
+
+from transactions.common.archive import Archive, ArchiveWriter
+from transactions.common.ndjson import read_transactions, write_transactions
+from transactions.common.schema import validate_transaction_schema
+from transactions.common.script import Script
+from transactions.common.transaction import Transaction
+from transactions.types.assets.create import Create
+from transactions.types.assets.transfer import Transfer
+
+from benchmarks import fixtures
+from benchmarks.runner import SkipBenchmark, benchmark
+
+INPUTS = (1, 10, 100)
+
+
+@benchmark("generate/create", caches=False)
+def generate_create():
+    recipients = [([fixtures.ALICE.public_key], 1)]
+    return partial(Create.generate, [fixtures.ALICE.public_key], recipients, assets=[{"data": fixtures.CID}])
+
+
+@benchmark("generate/transfer", caches=False)
+def generate_transfer():
+    spent = fixtures.create()
+    inputs = spent.to_inputs()
+    return partial(Transfer.generate, inputs, [([fixtures.BOB.public_key], 1)], asset_ids=[spent.id])
+
+
+def _sign(num_inputs: int, threshold: bool):
+    tx = fixtures.transfer(num_inputs, threshold, signed=False)
+    private_keys = fixtures.private_keys(threshold)
+    # NOTE: Signing replaces the Inputs by signed copies, so the same
+    #       Transaction can be signed over and over again
+    return partial(tx.sign, private_keys)
+
+
+for num_inputs in INPUTS:
+    benchmark("sign/ed25519/inputs={}".format(num_inputs))(partial(_sign, num_inputs, False))
+    benchmark("sign/threshold-2-of-3/inputs={}".format(num_inputs))(partial(_sign, num_inputs, True))
+
+
+def _to_dict():
+    return fixtures.transfer(10).to_dict
+
+
+def _from_dict():
+    return partial(Transaction.from_dict, fixtures.transfer(10).to_dict())
+
+
+for caches in (True, False):
+    memoization = "memo={}".format("on" if caches else "off")
+    benchmark("to_dict/inputs=10/" + memoization, caches=caches)(_to_dict)
+    benchmark("from_dict/inputs=10/" + memoization, caches=caches)(_from_dict)
+
+
+# NOTE: Version 2.0 has no COMPOSE and DECOMPOSE schemas
+SCHEMA_FIXTURES = {
+    ("3.0", "CREATE"): fixtures.create,
+    ("3.0", "TRANSFER"): fixtures.transfer,
+    ("3.0", "COMPOSE"): fixtures.compose,
+    ("3.0", "DECOMPOSE"): fixtures.decompose,
+    ("3.0", "VALIDATOR_ELECTION"): fixtures.validator_election,
+    ("3.0", "CHAIN_MIGRATION_ELECTION"): fixtures.chain_migration_election,
+    ("3.0", "VOTE"): fixtures.vote,
+    ("2.0", "CREATE"): lambda: fixtures.as_version_2(fixtures.create().to_dict()),
+    ("2.0", "TRANSFER"): lambda: fixtures.as_version_2(fixtures.transfer().to_dict()),
+    ("2.0", "VALIDATOR_ELECTION"): lambda: fixtures.as_version_2(fixtures.validator_election().to_dict()),
+    ("2.0", "CHAIN_MIGRATION_ELECTION"): lambda: fixtures.as_version_2(fixtures.chain_migration_election().to_dict()),
+    ("2.0", "VOTE"): lambda: fixtures.as_version_2(fixtures.vote().to_dict()),
+}
+
+
+def _schema(fixture):
+    tx = fixture()
+    tx_dict = tx.to_dict() if isinstance(tx, Transaction) else tx
+    return partial(validate_transaction_schema, tx_dict)
+
+
+for (version, operation), fixture in SCHEMA_FIXTURES.items():
+    benchmark("schema/{}/{}".format(version, operation))(partial(_schema, fixture))
+
+
+@benchmark("validate_id/inputs=10")
+def validate_id():
+    return partial(Transaction.validate_id, fixtures.transfer(10).to_dict())
+
+
+def _inputs_valid(threshold: bool):
+    tx = fixtures.transfer(10, threshold)
+    return partial(tx.inputs_valid, fixtures.spent_outputs(tx))
+
+
+for caches in (True, False):
+    memoization = "memo={}".format("on" if caches else "off")
+    benchmark("inputs_valid/ed25519/inputs=10/" + memoization, caches=caches)(partial(_inputs_valid, False))
+    benchmark("inputs_valid/threshold-2-of-3/inputs=10/" + memoization, caches=caches)(partial(_inputs_valid, True))
+
+
+ZENROOM_SCRIPT = """
+    Scenario 'test': Script verifies input
+    Given that I have a 'string dictionary' named 'houses'
+    Then print the string 'ok'
+"""
+
+
+@benchmark("script/validate")
+def script_validate():
+    if shutil.which("zencode-exec") is None:
+        raise SkipBenchmark("zencode-exec is not installed")
+    script = Script(ZENROOM_SCRIPT, {"houses": [{"name": "Harry", "team": "Gryffindor"}]}, ["ok"])
+    return script.validate
+
+
+@benchmark("script/key/code=16KiB")
+def script_key():
+    code = "Given nothing\n" * 1200
+
+    def key():
+        # NOTE: Like parsed Transactions, every Script gets its own copy of the code
+        return Script("".join((code[:1], code[1:])), {"houses": []}, ["ok"]).key
+
+    return key
+
+
+def _dump(records: int) -> str:
+    fp = io.StringIO()
+    write_transactions((fixtures.create() for _ in range(records)), fp)
+    return fp.getvalue()
+
+
+@benchmark("ndjson/write/records=100")
+def ndjson_write():
+    transactions = [fixtures.create() for _ in range(100)]
+    return lambda: write_transactions(transactions, io.StringIO())
+
+
+@benchmark("ndjson/read/records=100", caches=False)
+def ndjson_read():
+    dump = _dump(100)
+    return lambda: sum(1 for _ in read_transactions(io.StringIO(dump), validate=True))
+
+
+@benchmark("archive/get/records=10000", caches=False)
+def archive_get():
+    tx = fixtures.create().to_dict()
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "transactions")
+    with ArchiveWriter(path) as writer:
+        # NOTE: Only the looked up record has to be a valid transaction
+        writer.extend({"id": sha3_256(str(n).encode()).hexdigest()} for n in range(9999))
+        writer.append(tx)
+    archive = Archive(path)
+    # NOTE: The mapping outlives the files, where the platform allows it
+    shutil.rmtree(directory, ignore_errors=True)
+    return partial(archive.get, tx["id"])
@@ -0,0 +1,129 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# Planetmint and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+import os
+import random
+
+import pytest
+
+
+def test_archive_roundtrip(tmp_path, signed_create_tx, signed_transfer_tx):
+    from transactions.common.archive import Archive, ArchiveWriter
+    from transactions.common.ndjson import read_transactions
+
+    path = tmp_path / "transactions"
+    with ArchiveWriter(path) as writer:
+        writer.extend([signed_create_tx, signed_transfer_tx.to_dict(), signed_create_tx])
+    assert len(writer) == 2
+
+    with Archive(path) as archive:
+        assert len(archive) == 2
+        assert sorted(archive) == sorted([signed_create_tx.id, signed_transfer_tx.id])
+        assert signed_transfer_tx.id in archive
+        assert "0" * 64 not in archive
+        assert "not an id" not in archive
+
+        tx = archive[signed_transfer_tx.id]
+        assert tx._inputs is None
+        assert tx.to_dict() == signed_transfer_tx.to_dict()
+        assert archive.get(signed_create_tx.id, validate=True).to_dict() == signed_create_tx.to_dict()
+        assert archive.get("0" * 64) is None
+        with pytest.raises(KeyError):
+            archive["0" * 64]
+        with pytest.raises(ValueError):
+            archive.get("abc")
+
+    with open(path) as data:
+        assert [tx.id for tx in read_transactions(data)] == [
+            signed_create_tx.id,
+            signed_transfer_tx.id,
+            signed_create_tx.id,
+        ]
+
+
+def test_archive_lookup(tmp_path):
+    from transactions.common.archive import Archive, ArchiveWriter
+
+    rng = random.Random(0)
+    ids = [bytes(rng.getrandbits(8) for _ in range(32)).hex() for _ in range(1000)]
+    # NOTE: Clustered ids exercise the bisection fallback
+    ids += ["00" * 31 + "{:02x}".format(i) for i in range(16)]
+    path = tmp_path / "transactions"
+    with ArchiveWriter(path) as writer:
+        writer.extend({"id": tx_id, "n": n} for n, tx_id in enumerate(ids))
+
+    with Archive(path) as archive:
+        assert list(archive) == sorted(ids)
+        for n, tx_id in enumerate(ids):
+            with archive.read(tx_id) as record:
+                assert bytes(record) == '{{"id":"{}","n":{}}}'.format(tx_id, n).encode()
+        assert not any(bytes(rng.getrandbits(8) for _ in range(32)).hex() in archive for _ in range(100))
+
+
+def test_archive_empty_and_corrupt(tmp_path):
+    from transactions.common.archive import INDEX_SUFFIX, Archive, ArchiveWriter
+
+    path = tmp_path / "transactions"
+    ArchiveWriter(path).close()
+    with Archive(path) as archive:
+        assert len(archive) == 0
+        assert "0" * 64 not in archive
+
+    with open(str(path) + INDEX_SUFFIX, "ab") as index:
+        index.write(b"\0")
+    with pytest.raises(ValueError):
+        Archive(path)
+
+    ids = ["{:064x}".format(n) for n in range(1, 4)]
+    with ArchiveWriter(path) as writer:
+        writer.extend({"id": tx_id} for tx_id in ids)
+    with open(str(path) + INDEX_SUFFIX, "rb") as index:
+        stale_index = index.read()
+
+    with pytest.raises(RuntimeError):
+        with ArchiveWriter(path) as writer:
+            writer.append({"id": ids[2], "rewritten": True})
+            # NOTE: Neither a running nor a failed rewrite leaves the old
+            #       index behind
+            with pytest.raises(FileNotFoundError):
+                Archive(path)
+            raise RuntimeError()
+    assert not os.path.exists(str(path) + INDEX_SUFFIX)
+    with pytest.raises(FileNotFoundError):
+        Archive(path)
+
+    with ArchiveWriter(path) as writer:
+        writer.append({"id": ids[0], "rewritten": True})
+    with open(str(path) + INDEX_SUFFIX, "wb") as index:
+        index.write(stale_index)
+    with pytest.raises(ValueError):
+        Archive(path)
+
+
+def test_archive_keeps_first_duplicate(tmp_path):
+    from transactions.common.archive import Archive, ArchiveWriter
+    from transactions.common.utils import serialize
+
+    def filler(size):
+        # NOTE: A record of `size` bytes, including the newline
+        padding = size - len(serialize({"id": "f" * 64, "pad": ""})) - 1
+        return {"id": "f" * 64, "pad": "x" * padding}
+
+    tx_id = "0" * 64
+    path = tmp_path / "transactions"
+    with ArchiveWriter(path) as writer:
+        # NOTE: The copies are at offsets 200 and 400. In little-endian
+        #       bytes the latter sorts first, as 400 % 256 < 200
+        writer.append(filler(200))
+        first = {"id": tx_id, "copy": 1}
+        writer.append(first)
+        writer.append(filler(400 - 200 - len(serialize(first)) - 1))
+        assert writer._offset == 400
+        writer.append({"id": tx_id, "copy": 2})
+
+    with Archive(path) as archive:
+        assert len(archive) == 2
+        with archive.read(tx_id) as record:
+            assert bytes(record) == serialize(first).encode()
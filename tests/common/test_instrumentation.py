@@ -0,0 +1,94 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# Planetmint and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+import pytest
+
+from transactions.common import instrumentation
+from transactions.common.instrumentation import MetricsRegistry, set_sink
+from transactions.common.transaction import Transaction
+
+
+@pytest.fixture
+def registry():
+    registry = MetricsRegistry()
+    previous = set_sink(registry)
+    yield registry
+    set_sink(previous)
+
+
+def test_instrumentation_is_disabled_by_default():
+    assert instrumentation.get_sink() is None
+    assert instrumentation.span("noop") is instrumentation.span("other")
+    instrumentation.count("noop")
+
+
+def test_spans_of_transaction_lifecycle(registry, utx, user_priv):
+    tx = utx.sign([user_priv])
+    tx_dict = tx.to_dict()
+    tx.to_dict()
+    Transaction.from_dict(tx_dict, False)
+    assert tx.inputs_valid()
+    assert tx.inputs_valid()
+
+    snapshot = registry.snapshot()
+    spans = snapshot["spans"]
+    for name in (
+        "transaction.sign",
+        "transaction.from_dict",
+        "transaction.validate_schema",
+        "transaction.validate_id",
+        "transaction.input_valid",
+        "fulfillment.parse",
+        "fulfillment.verify",
+    ):
+        assert spans[name]["count"] >= 1, name
+        assert spans[name]["buckets"][float("inf")] == spans[name]["count"]
+    assert spans["transaction.input_valid"]["count"] == 2
+    assert spans["fulfillment.verify"]["count"] == 1
+    assert snapshot["counters"]["transaction.verification.cache_hits"] == 1
+    assert snapshot["counters"]["transaction.to_dict.cache_hits"] >= 1
+
+
+def test_callback_sink():
+    events = []
+    previous = set_sink(lambda kind, name, value: events.append((kind, name, value)))
+    try:
+        with instrumentation.span("block"):
+            pass
+        instrumentation.count("events", 2)
+    finally:
+        set_sink(previous)
+
+    assert [(kind, name) for kind, name, _ in events] == [("span", "block"), ("count", "events")]
+    assert events[0][2] >= 0
+    assert events[1][2] == 2
+
+
+def test_timed_records_failing_calls(registry):
+    @instrumentation.timed("failing")
+    def failing():
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        failing()
+    assert registry.snapshot()["spans"]["failing"]["count"] == 1
+
+
+def test_metrics_registry_render():
+    registry = MetricsRegistry(buckets=(0.001, 0.01))
+    registry.span("transaction.sign", 0.0005)
+    registry.span("transaction.sign", 0.005)
+    registry.span("transaction.sign", 0.5)
+    registry.count("transaction.to_dict.cache_hits", 3)
+
+    assert registry.snapshot()["spans"]["transaction.sign"]["buckets"] == {0.001: 1, 0.01: 2, float("inf"): 3}
+    rendered = registry.render()
+    assert 'transactions_span_seconds_bucket{span="transaction.sign",le="0.01"} 2' in rendered
+    assert 'transactions_span_seconds_bucket{span="transaction.sign",le="+Inf"} 3' in rendered
+    assert 'transactions_span_seconds_count{span="transaction.sign"} 3' in rendered
+    assert 'transactions_events_total{event="transaction.to_dict.cache_hits"} 3' in rendered
+
+    registry.reset()
+    assert registry.snapshot() == {"spans": {}, "counters": {}}
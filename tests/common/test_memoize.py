@@ -6,10 +6,20 @@
 import pytest
 from copy import deepcopy
 
+from transactions.common.utils import deserialize, serialize_transaction
 from transactions.common.transaction import Transaction
 from transactions.types.assets.create import Create
 from transactions.common.crypto import generate_key_pair
-from transactions.common.memoize import to_dict, from_dict
+from transactions.common.memoize import (
+    to_dict,
+    from_dict,
+    verification_cache,
+    LRUCache,
+    cache_stats,
+    configure_cache,
+    FrozenDict,
+    conditions,
+)
 
 
 def test_memoize_to_dict():
@@ -67,8 +77,9 @@ def test_memoize_input_valid():
     alice = generate_key_pair()
     assets = [{"data": "QmaozNR7DZHQK1ZcU9p7QdrshMvXqWK6gpu5rmrkPdT3L4"}]
 
-    assert Transaction._input_valid.cache_info().hits == 0
-    assert Transaction._input_valid.cache_info().misses == 0
+    verification_cache.clear()
+    assert verification_cache.cache_info().hits == 0
+    assert verification_cache.cache_info().misses == 0
 
     tx = Create.generate(
         [alice.public_key],
@@ -78,11 +89,154 @@ def test_memoize_input_valid():
 
     tx.inputs_valid()
 
-    assert Transaction._input_valid.cache_info().hits == 0
-    assert Transaction._input_valid.cache_info().misses == 1
+    assert verification_cache.cache_info().hits == 0
+    assert verification_cache.cache_info().misses == 1
+    assert verification_cache.cache_info().currsize == 1
 
     tx.inputs_valid()
     tx.inputs_valid()
 
-    assert Transaction._input_valid.cache_info().hits == 2
-    assert Transaction._input_valid.cache_info().misses == 1
+    assert verification_cache.cache_info().hits == 2
+    assert verification_cache.cache_info().misses == 1
+
+    verification_cache.clear()
+    assert verification_cache.cache_info() == (0, 0, 0, verification_cache.maxsize, 0, 0)
+
+
+def test_lru_cache_eviction():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.cache_info() == (2, 1, 1, 2, 2, 0)
+
+    cache.configure(maxsize=1)
+    assert len(cache) == 1
+    assert cache.get("a") == 1
+    assert cache.cache_info().evictions == 2
+
+
+def test_lru_cache_ttl():
+    now = [0]
+    cache = LRUCache(maxsize=2, ttl=10, timer=lambda: now[0])
+    cache.put("a", 1)
+    now[0] = 9
+    assert cache.get("a") == 1
+    now[0] = 10
+    assert cache.get("a") is None
+    assert cache.cache_info() == (1, 1, 1, 2, 0, 0)
+
+
+def test_lru_cache_max_bytes():
+    cache = LRUCache(maxsize=None, max_bytes=10, sizeof=lambda key, value: len(value))
+    cache.put("a", "aaaa")
+    cache.put("b", "bbbb")
+    assert cache.cache_info().bytes == 8
+    cache.put("c", "cccc")
+
+    assert cache.get("a") is None
+    assert cache.cache_info().bytes == 8
+    assert cache.cache_info().evictions == 1
+
+
+def test_configure_cache(signed_create_tx):
+    assert {"from_dict", "to_dict", "verification"} <= set(cache_stats())
+
+    configure_cache("to_dict", enabled=False)
+    try:
+        tx_dict = signed_create_tx.to_frozen_dict()
+        assert signed_create_tx.to_frozen_dict() is not tx_dict
+        assert cache_stats()["to_dict"]["currsize"] == 0
+    finally:
+        configure_cache("to_dict", enabled=True)
+
+    tx_dict = signed_create_tx.to_frozen_dict()
+    assert signed_create_tx.to_frozen_dict() is tx_dict
+    assert cache_stats()["to_dict"]["bytes"] > 0
+
+
+def test_to_dict_returns_private_copy(signed_create_tx):
+    tx_dict = signed_create_tx.to_dict()
+    tx_dict["inputs"][0]["fulfillment"] = None
+    tx_dict["metadata"] = "changed"
+
+    assert signed_create_tx.to_dict() != tx_dict
+    assert signed_create_tx.to_dict() == signed_create_tx.to_frozen_dict()
+
+
+def test_frozen_dict_is_read_only(signed_create_tx):
+    tx_dict = signed_create_tx.to_frozen_dict()
+    assert isinstance(tx_dict, FrozenDict)
+
+    with pytest.raises(TypeError):
+        tx_dict["id"] = None
+    with pytest.raises(TypeError):
+        tx_dict.pop("id")
+    with pytest.raises(TypeError):
+        tx_dict["inputs"].append({})
+    with pytest.raises(TypeError):
+        tx_dict["inputs"][0]["fulfillment"] = None
+
+    mutable = deepcopy(tx_dict)
+    mutable["inputs"][0]["fulfillment"] = None
+    assert type(mutable) is dict
+    assert type(mutable["inputs"]) is list
+    assert mutable == deserialize(serialize_transaction(signed_create_tx.to_dict()))
+
+
+def test_frozen_dict_is_invalidated(user_pub, user_priv, user2_pub):
+    tx = Create.generate([user_pub], [([user_pub], 1)])
+    tx.sign([user_priv])
+    signed = tx.to_frozen_dict()
+
+    tx.add_output(tx.outputs[0].generate([user2_pub], 1))
+    assert len(tx.to_frozen_dict()["outputs"]) == 2
+
+    tx.sign([user_priv])
+    assert tx.id != signed["id"]
+    assert len(tx.to_frozen_dict()["outputs"]) == 2
+    assert tx.to_frozen_dict()["id"] == tx.id
+
+
+def test_memoize_conditions(user_pub, user2_pub):
+    from transactions.common.output import Output
+    from transactions.common.utils import _fulfillment_to_details
+
+    conditions.clear()
+    output = Output.generate([user_pub, user2_pub], 1)
+    expected = {"uri": output.fulfillment.condition_uri, "details": _fulfillment_to_details(output.fulfillment)}
+    assert output.to_dict()["condition"] == expected
+    assert conditions.cache_info().misses == 1
+
+    parsed = Output.from_dict(output.to_dict())
+    assert parsed.condition_uri == expected["uri"]
+    assert Output.generate([user_pub, user2_pub], 2).to_dict()["condition"] == expected
+    assert conditions.cache_info().hits == 2
+    assert conditions.cache_info().currsize == 1
+
+    details = parsed.to_dict()["condition"]["details"]
+    details["threshold"] = 1
+    assert parsed.to_dict()["condition"] == expected
+
+    one_of_two = Output.from_dict({**output.to_dict(), "condition": {"details": details}})
+    assert one_of_two.condition_uri != expected["uri"]
+    assert conditions.cache_info().currsize == 2
+
+
+def test_memoized_condition_follows_fulfillment(user_pub, user2_pub):
+    from transactions.common.output import Output
+
+    output = Output.generate([user_pub, user2_pub], 1)
+    two_of_two = output.to_dict()["condition"]
+
+    output.fulfillment.threshold = 1
+    assert output.condition_uri == output.fulfillment.condition_uri
+    assert output.condition_uri != two_of_two["uri"]
+    assert output.to_dict()["condition"]["details"]["threshold"] == 1
+
+    output.fulfillment.threshold = 2
+    assert output.to_dict()["condition"] == two_of_two
@@ -0,0 +1,134 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# Planetmint and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+import io
+
+import pytest
+
+
+def test_write_read_roundtrip(signed_create_tx, signed_transfer_tx):
+    from transactions.common.ndjson import read_transactions, write_transactions
+
+    fp = io.StringIO()
+    transactions = (tx for tx in [signed_create_tx, signed_transfer_tx.to_dict(), signed_create_tx])
+    assert write_transactions(transactions, fp, chunk_size=2) == 3
+    dump = fp.getvalue()
+    assert dump.count("\n") == 3
+
+    fp = io.StringIO(dump + "\n")
+    assert [tx.to_dict() for tx in read_transactions(fp, validate=True)] == [
+        signed_create_tx.to_dict(),
+        signed_transfer_tx.to_dict(),
+        signed_create_tx.to_dict(),
+    ]
+
+    fp = io.BytesIO(dump.encode())
+    assert [tx.id for tx in read_transactions(fp)] == [signed_create_tx.id, signed_transfer_tx.id, signed_create_tx.id]
+
+
+def test_read_invalid_records(signed_create_tx):
+    from transactions.common.exceptions import InvalidHash, InvalidRecord, SchemaValidationError
+    from transactions.common.ndjson import read_transactions
+    from transactions.common.utils import serialize
+
+    record = serialize(signed_create_tx.to_dict())
+    tampered = signed_create_tx.to_dict()
+    tampered["id"] = "a" * 64
+    lines = [record, "", "{not json", serialize(tampered), record]
+
+    with pytest.raises(InvalidRecord) as exc_info:
+        list(read_transactions(lines))
+    assert exc_info.value.line == 3
+    assert isinstance(exc_info.value.error, SchemaValidationError)
+
+    errors = []
+    transactions = list(read_transactions(lines, validate=True, on_error=errors.append))
+    assert [tx.id for tx in transactions] == [signed_create_tx.id] * 2
+    assert [error.line for error in errors] == [3, 4]
+    assert isinstance(errors[1].error, InvalidHash)
+    assert str(errors[1]).startswith("line 4: ")
+
+
+def test_read_malformed_records_without_validation(signed_create_tx):
+    from transactions.common.exceptions import InvalidRecord, SchemaValidationError
+    from transactions.common.ndjson import read_transactions
+    from transactions.common.utils import serialize
+
+    tx_dict = signed_create_tx.to_dict()
+    missing_outputs = {key: value for key, value in tx_dict.items() if key != "outputs"}
+    invalid_inputs = {**tx_dict, "inputs": 5}
+    lines = [serialize(missing_outputs), serialize(tx_dict), serialize(invalid_inputs)]
+
+    with pytest.raises(InvalidRecord) as exc_info:
+        list(read_transactions(lines))
+    assert exc_info.value.line == 1
+    assert isinstance(exc_info.value.error, SchemaValidationError)
+    assert isinstance(exc_info.value.error.__cause__, KeyError)
+
+    errors = []
+    assert [tx.id for tx in read_transactions(lines, on_error=errors.append)] == [signed_create_tx.id]
+    assert [error.line for error in errors] == [1, 3]
+    assert isinstance(errors[1].error.__cause__, TypeError)
+
+
+def test_read_batches(signed_create_tx):
+    from transactions.common.ndjson import batched, read_batches
+    from transactions.common.utils import serialize
+
+    lines = (serialize(signed_create_tx.to_dict()) for _ in range(5))
+    assert [len(batch) for batch in read_batches(lines, 2, validate=True)] == [2, 2, 1]
+
+    with pytest.raises(ValueError):
+        next(batched([], 0))
+
+
+def test_read_reports_only_invalid_records(signed_create_tx, monkeypatch):
+    from transactions.common.exceptions import InvalidRecord, SchemaValidationError
+    from transactions.common.ndjson import read_transactions
+    from transactions.common.transaction import Transaction
+    from transactions.common.utils import serialize
+
+    tx_dict = signed_create_tx.to_dict()
+    tx_dict["operation"] = ["CREATE"]
+    with pytest.raises(InvalidRecord) as exc_info:
+        list(read_transactions([serialize(tx_dict)]))
+    assert isinstance(exc_info.value.error, SchemaValidationError)
+
+    def from_json(*args, **kwargs):
+        raise TypeError("bug")
+
+    monkeypatch.setattr(Transaction, "from_json", from_json)
+    with pytest.raises(TypeError):
+        list(read_transactions([serialize(signed_create_tx.to_dict())], on_error=lambda error: None))
+
+
+def test_read_invalid_script(zenroom, signed_create_tx, user_pub, user_priv):
+    from transactions.common.exceptions import InvalidRecord, InvalidScript
+    from transactions.common.memoize import from_dict, script_results
+    from transactions.common.ndjson import read_transactions
+    from transactions.common.script import Script
+    from transactions.common.utils import serialize
+    from transactions.types.assets.create import Create
+
+    script = Script("Then print the string 'ok'", {"houses": []}, ["not ok"])
+    zenroom.output = '{"output": ["not ok"]}'
+    tx = Create.generate([user_pub], [([user_pub], 1)], script=script).sign([user_priv])
+    from_dict.clear()
+    script_results.clear()
+    zenroom.output = '{"output": ["ok"]}'
+
+    record = serialize(signed_create_tx.to_dict())
+    lines = [record, serialize(tx.to_dict()), record]
+
+    with pytest.raises(InvalidRecord) as exc_info:
+        list(read_transactions(lines))
+    assert exc_info.value.line == 2
+    assert isinstance(exc_info.value.error, InvalidScript)
+
+    errors = []
+    transactions = list(read_transactions(lines, on_error=errors.append))
+    assert [tx.id for tx in transactions] == [signed_create_tx.id] * 2
+    assert [error.line for error in errors] == [2]
+    assert isinstance(errors[0].error, InvalidScript)
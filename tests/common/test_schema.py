@@ -11,7 +11,7 @@ from unittest.mock import patch
 
 from hypothesis import given
 from hypothesis.strategies import from_regex as regex
-from pytest import raises
+from pytest import mark, raises
 
 from transactions.common.exceptions import SchemaValidationError
 from transactions.common.schema import (
@@ -153,3 +153,57 @@ def test_condition_uri_with_unknown_subtype(dummy_transaction, condition_uri):
     dummy_transaction["outputs"][0]["condition"]["uri"] = condition_uri
     with raises(SchemaValidationError):
         validate_transaction_schema(dummy_transaction)
+
+
+################################################################################
+# Test of the merged per operation schemas
+
+
+def test_validate_transaction_serializes_once(signed_transfer_tx):
+    import rapidjson
+
+    with patch("transactions.common.schema.rapidjson.dumps", wraps=rapidjson.dumps) as dumps:
+        validate_transaction_schema(signed_transfer_tx.to_dict())
+    assert dumps.call_count == 1
+
+
+def test_validate_transaction_operation_schema(create_tx):
+    tx = create_tx.to_dict()
+    tx["inputs"] = tx["inputs"] * 2
+    with raises(SchemaValidationError):
+        validate_transaction_schema(tx)
+
+
+@mark.parametrize("operation", [["CREATE"], {"CREATE": None}])
+def test_validate_transaction_unhashable_operation(create_tx, operation):
+    tx = create_tx.to_dict()
+    tx["operation"] = operation
+    with raises(SchemaValidationError):
+        validate_transaction_schema(tx)
+
+
+def test_register_type_schema(create_tx):
+    from transactions.common.transaction import Transaction
+    from transactions.common.schema import _tx_schemas
+
+    schema = {
+        "type": "object",
+        "required": ["metadata"],
+        "properties": {"metadata": {"$ref": "#/definitions/metadata"}},
+        "definitions": {"metadata": {"type": "string", "pattern": "^Qm"}},
+    }
+    tx = create_tx.to_dict()
+    tx["operation"] = "NOTARIZE"
+    tx["metadata"] = "QmaozNR7DZHQK1ZcU9p7QdrshMvXqWK6gpu5rmrkPdT3L4"
+    with raises(SchemaValidationError):
+        validate_transaction_schema(tx)
+
+    Transaction.register_type("NOTARIZE", Transaction, {"3.0": [schema]})
+    try:
+        validate_transaction_schema(tx)
+        tx["metadata"] = None
+        with raises(SchemaValidationError):
+            validate_transaction_schema(tx)
+    finally:
+        del Transaction.type_registry["NOTARIZE"]
+        del _tx_schemas[("3.0", "NOTARIZE")]
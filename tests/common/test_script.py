@@ -55,3 +55,88 @@ def test_from_dict():
     script_dict = script.to_dict()
     script_from_dict = Script.from_dict(script_dict)
     assert script_from_dict.validate()
+
+
+def test_validate_memoizes_results(zenroom):
+    assert Script(zenroom_script, inputs, outputs).validate()
+    assert not Script(zenroom_script, inputs, invalid_outputs).validate()
+    assert zenroom.calls == 1
+
+    reordered = {"houses": [{"team": house["team"], "name": house["name"]} for house in inputs["houses"]]}
+    assert Script(zenroom_script, reordered, outputs).validate()
+    assert zenroom.calls == 1
+
+    assert Script(zenroom_script, {"houses": []}, outputs).validate()
+    assert zenroom.calls == 2
+
+
+def test_validate_invalid_result(zenroom):
+    zenroom.output = "not json"
+    assert not Script(zenroom_script, inputs, outputs).validate()
+    assert not Script(zenroom_script, inputs, outputs).validate()
+    assert zenroom.calls == 1
+
+
+def test_script_pool(zenroom):
+    from transactions.common.script import ScriptPool
+
+    scripts = [Script(zenroom_script, {"houses": [{"name": str(i)}]}, outputs) for i in range(8)]
+    with ScriptPool(max_workers=4, timeout=10) as pool:
+        assert pool.validate_many(scripts) == [True] * 8
+        assert not pool.validate(Script(zenroom_script, inputs, invalid_outputs))
+    assert zenroom.calls == 9
+
+    assert all(script.validate() for script in scripts)
+    assert zenroom.calls == 9
+
+
+def test_script_pool_timeout(zenroom):
+    from transactions.common.exceptions import ScriptTimeout
+    from transactions.common.script import ScriptPool
+
+    zenroom.delay = 10
+    with ScriptPool(max_workers=1, timeout=0.01) as pool:
+        with pytest.raises(ScriptTimeout):
+            pool.validate(Script(zenroom_script, inputs, outputs))
+        zenroom.release.set()
+
+
+def test_scripts_share_contracts(zenroom):
+    import copy
+    import pickle
+
+    from transactions.common.script import contracts
+
+    code = "".join(zenroom_script)
+    script = Script(zenroom_script, inputs, outputs)
+    other = Script(code, {"houses": []}, outputs)
+    assert script.contract is other.contract
+    assert script.code is other.code
+    assert script.contract.id in contracts
+    assert copy.deepcopy(script).contract is script.contract
+    assert pickle.loads(pickle.dumps(script)).contract is script.contract
+
+    assert Script.from_dict(script.to_dict()).key == script.key
+    assert other.key != script.key
+
+
+def test_script_from_contract(zenroom):
+    import gc
+
+    from transactions.common.script import contracts
+
+    code = "Given nothing\nThen print the string 'ok'\n"
+    contract_id = contracts.register(code)
+    gc.collect()
+    script = Script.from_contract(contract_id, inputs, outputs)
+    assert script.code == code
+    assert script.validate()
+
+    contracts.unregister(contract_id)
+    del script
+    gc.collect()
+    assert contract_id not in contracts
+    with pytest.raises(KeyError):
+        Script.from_contract(contract_id, inputs, outputs)
+    with pytest.raises(TypeError):
+        Script(None, inputs, outputs)
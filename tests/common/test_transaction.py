@@ -17,6 +17,7 @@ from transactions.common.transaction import Input
 from transactions.common.exceptions import AmountError
 from transactions.common.transaction import Transaction
 from transactions.common.transaction import TransactionLink
+from transactions.common.transaction import UnspentOutput
 from planetmint_cryptoconditions import ThresholdSha256
 from planetmint_cryptoconditions import Fulfillment
 from planetmint_cryptoconditions import PreimageSha256
@@ -585,7 +586,7 @@ def test_validate_inputs_of_transfer_tx_with_invalid_params(
     invalid_out = Output(Ed25519Sha256.from_uri(ffill_uri), ["invalid"])
     assert transfer_tx.inputs_valid([invalid_out]) is False
     invalid_out = utx.outputs[0]
-    invalid_out.public_key = "invalid"
+    invalid_out.public_keys = ["invalid"]
     assert transfer_tx.inputs_valid([invalid_out]) is True
 
     with raises(TypeError):
@@ -965,3 +966,352 @@ def test_v2_0_transaction_from_dict_transfer(signed_2_0_transfer_tx):
     assert Transaction.validate_id(mydict) == True
     assert isinstance(transaction.assets, dict)
     assert isinstance(mydict["asset"], dict)
+
+
+def _remove_signatures(tx_dict):
+    unsigned = deepcopy(tx_dict)
+    for input_ in unsigned["inputs"]:
+        input_["fulfillment"] = None
+    return unsigned
+
+
+def test_canonical_str_matches_remove_signatures(signed_transfer_tx):
+    tx_dict = signed_transfer_tx.to_dict()
+    expected = deepcopy(tx_dict)
+
+    unsigned = _remove_signatures(tx_dict)
+    assert Transaction._to_canonical_str(tx_dict) == Transaction._to_str(unsigned)
+    assert Transaction._to_canonical_str(signed_transfer_tx) == str(signed_transfer_tx)
+    unsigned["id"] = None
+    assert Transaction._to_canonical_str(tx_dict, strip_id=True) == Transaction._to_str(unsigned)
+    assert tx_dict == expected
+
+
+def test_signing_digest(signed_transfer_tx):
+    tx_dict = signed_transfer_tx.to_dict()
+    unsigned = _remove_signatures(tx_dict)
+    unsigned["id"] = None
+    fulfills = signed_transfer_tx.inputs[0].fulfills
+    message = Transaction._to_str(unsigned) + "{}{}".format(fulfills.txid, fulfills.output)
+
+    assert signed_transfer_tx.signing_digest(0) == sha3_256(message.encode()).digest()
+
+
+def test_delegate_signing_multiple_inputs(user_input, user_output, user_priv, user_pub, asset_definition):
+    from transactions.common.crypto import PrivateKey
+
+    tx = Transaction(Transaction.CREATE, asset_definition, [user_input], [user_output, deepcopy(user_output)])
+    tx.sign([user_priv])
+    transfer_tx = Transaction("TRANSFER", [{"id": tx.id}], tx.to_inputs(), [deepcopy(user_output)])
+
+    def signing_callback(input_, digest):
+        return PrivateKey(user_priv).sign(digest, encoding="bytes")
+
+    transfer_tx.delegate_signing(signing_callback)
+    assert transfer_tx.inputs_valid(tx.outputs) is True
+
+
+def test_transaction_from_json(signed_create_tx, signed_transfer_tx):
+    for tx in (signed_create_tx, signed_transfer_tx):
+        tx_json = Transaction._to_str(tx.to_dict())
+        assert Transaction.from_json(tx_json) == tx
+        assert Transaction.from_json(tx_json.encode()) == tx
+
+
+def test_transaction_from_json_validates_raw_json(signed_transfer_tx):
+    import rapidjson
+    from unittest.mock import patch
+    from transactions.common.exceptions import SchemaValidationError
+
+    tx_json = Transaction._to_str(signed_transfer_tx.to_dict())
+    with patch("rapidjson.dumps", wraps=rapidjson.dumps) as dumps:
+        Transaction.from_json(tx_json)
+    # NOTE: only the canonical encoding the id is checked against
+    assert dumps.call_count == 1
+
+    with raises(SchemaValidationError):
+        Transaction.from_json(tx_json[:-1])
+    with raises(SchemaValidationError):
+        Transaction.from_json("[]")
+    with raises(SchemaValidationError):
+        Transaction.from_json(tx_json[:-1] + ',"junk":1}')
+
+
+@mark.parametrize("validate", [True, False])
+def test_transaction_from_json_unhashable_operation(signed_create_tx, validate):
+    from transactions.common.exceptions import SchemaValidationError
+
+    tx_dict = signed_create_tx.to_dict()
+    tx_dict["operation"] = ["CREATE"]
+    with raises(SchemaValidationError):
+        Transaction.from_json(Transaction._to_str(tx_dict), validate=validate)
+
+
+def test_transaction_from_json_invalid_id(signed_create_tx):
+    tx_dict = signed_create_tx.to_dict()
+    tx_dict["metadata"] = "QmaozNR7DZHQK1ZcU9p7QdrshMvXqWK6gpu5rmrkPdT3L4"
+    tx_json = Transaction._to_str(tx_dict)
+
+    with raises(InvalidHash):
+        Transaction.from_json(tx_json)
+    assert Transaction.from_json(tx_json, validate=False).metadata == tx_dict["metadata"]
+
+
+def test_transaction_from_dict_lazy(signed_transfer_tx):
+    from unittest.mock import patch
+
+    tx_dict = signed_transfer_tx.to_dict()
+    with patch.object(Input, "from_dict") as input_from_dict, patch.object(Output, "from_dict") as output_from_dict:
+        tx = Transaction.from_dict(tx_dict, lazy=True)
+        assert tx.id == signed_transfer_tx.id
+        assert tx.assets == signed_transfer_tx.assets
+        assert list(tx.spent_outputs) == list(signed_transfer_tx.spent_outputs)
+        assert list(tx.unspent_outputs) == list(signed_transfer_tx.unspent_outputs)
+    input_from_dict.assert_not_called()
+    output_from_dict.assert_not_called()
+    assert not tx.is_materialized
+
+    assert tx.inputs == signed_transfer_tx.inputs
+    assert tx.outputs == signed_transfer_tx.outputs
+    assert tx.is_materialized
+    assert tx == signed_transfer_tx
+
+
+def test_lazy_transaction_modified(signed_create_tx, user_output):
+    tx = Transaction.from_dict(signed_create_tx.to_dict(), lazy=True)
+    tx.add_output(user_output)
+
+    assert tx.tx_dict is None
+    assert tx.outputs == signed_create_tx.outputs + [user_output]
+    assert tx.inputs == signed_create_tx.inputs
+
+
+def test_input_output_link_slots(signed_transfer_tx):
+    for obj in (signed_transfer_tx.inputs[0], signed_transfer_tx.outputs[0], signed_transfer_tx.inputs[0].fulfills):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_structural_equality_and_hash(signed_transfer_tx, user_output, user2_output):
+    tx = Transaction.from_dict(deepcopy(signed_transfer_tx.to_dict()), lazy=True)
+
+    assert tx.inputs[0] is not signed_transfer_tx.inputs[0]
+    assert tx.inputs[0] == signed_transfer_tx.inputs[0]
+    assert hash(tx.inputs[0]) == hash(signed_transfer_tx.inputs[0])
+    assert tx.outputs[0] == signed_transfer_tx.outputs[0]
+    assert hash(tx.outputs[0]) == hash(signed_transfer_tx.outputs[0])
+    assert TransactionLink("abc", 0) == TransactionLink("abc", 0)
+    assert TransactionLink("abc", 0) != TransactionLink("abc", 1)
+    fulfillment = tx.inputs[0].fulfillment
+    assert Input(fulfillment, [], None) == Input(fulfillment, [], TransactionLink())
+
+    forged = deepcopy(tx.inputs[0])
+    forged.fulfillment.signature = bytes(64)
+    assert forged != tx.inputs[0]
+    assert user_output != user2_output
+    assert user_output != "not an output"
+
+
+def test_output_condition_uri_cached(user_output, user2_output):
+    assert user_output.condition_uri == user_output.fulfillment.condition_uri
+    user_output.fulfillment = user2_output.fulfillment
+    assert user_output.condition_uri == user2_output.condition_uri
+
+
+def test_batch_unspent_outputs(signed_create_tx, signed_transfer_tx):
+    lazy_tx = Transaction.from_dict(deepcopy(signed_transfer_tx.to_dict()), lazy=True)
+    transactions = [signed_create_tx, signed_transfer_tx, lazy_tx]
+
+    columns = Transaction.batch_unspent_outputs(transactions)
+    expected = [utxo for tx in transactions for utxo in tx.unspent_outputs]
+
+    assert columns.amounts.typecode == "q"
+    assert [
+        UnspentOutput(txid.hex(), index, amount, asset_id, uri) for txid, index, amount, asset_id, uri in zip(*columns)
+    ] == expected
+    assert not lazy_tx.is_materialized
+
+
+def test_sign_with_keyring(utx, user_pub, user_priv, user2_pub, user2_priv):
+    from transactions.common.crypto import Keyring
+
+    keyring = Keyring([user_priv, user2_priv])
+    assert user_pub in keyring and user2_pub in keyring
+    assert len(keyring) == 2
+
+    expected = deepcopy(utx).sign([user_priv])
+    assert utx.sign(keyring).to_dict() == expected.to_dict()
+    assert utx.inputs_valid()
+
+
+def test_delegate_signing_with_keyring(utx, user_priv):
+    from transactions.common.crypto import Keyring
+
+    expected = deepcopy(utx).sign([user_priv])
+    assert utx.delegate_signing(Keyring([user_priv])).to_dict() == expected.to_dict()
+
+
+def test_sign_with_keyring_missing_key(utx, user2_priv):
+    from transactions.common.crypto import Keyring
+    from transactions.common.exceptions import KeypairMismatchException
+
+    with raises(KeypairMismatchException):
+        utx.sign(Keyring([user2_priv]))
+
+
+def test_sign_inputs_concurrently(user_input, user_user2_threshold_input, user_output, user_priv, user2_priv):
+    inputs = [user_input, user_user2_threshold_input] * 4
+    inputs = [
+        Input(input_.fulfillment, input_.owners_before, TransactionLink("a" * 64, i))
+        for i, input_ in enumerate(inputs)
+    ]
+
+    def transfer():
+        return Transfer(Transfer.OPERATION, [{"id": "b" * 64}], list(inputs), [user_output])
+
+    expected = transfer().sign([user_priv, user2_priv])
+    tx = transfer().sign([user_priv, user2_priv], max_workers=4)
+
+    assert tx.to_dict() == expected.to_dict()
+    assert tx.inputs_valid([Output(input_.fulfillment, input_.owners_before) for input_ in inputs])
+    # NOTE: The Inputs passed in are never signed in place
+    assert user_input.fulfillment.signature is None
+    assert all(sub["body"].signature is None for sub in user_user2_threshold_input.fulfillment.subconditions)
+
+
+def test_sign_inputs_concurrently_missing_key(user_input, user_output, user2_priv):
+    from transactions.common.exceptions import KeypairMismatchException
+
+    tx = Transfer(Transfer.OPERATION, [{"id": "b" * 64}], [user_input, user_input], [user_output])
+    with raises(KeypairMismatchException):
+        tx.sign([user2_priv], max_workers=2)
+
+
+def test_copy_fulfillment_keeps_signatures(user_user2_threshold, user_priv):
+    from transactions.common.crypto import Keyring
+    from transactions.common.utils import _copy_fulfillment
+
+    keyring = Keyring([user_priv])
+    (public_key,) = keyring.public_keys
+    threshold = _copy_fulfillment(user_user2_threshold)
+    for subffill in threshold.get_subcondition_from_vk(keyring.raw_public_key(public_key)):
+        Transaction._sign_fulfillment(subffill, keyring, public_key, b"message")
+
+    copy = _copy_fulfillment(threshold)
+    assert copy is not threshold
+    assert copy.condition_uri == user_user2_threshold.condition_uri
+    assert [sub["body"].signature for sub in copy.subconditions] == [
+        sub["body"].signature for sub in threshold.subconditions
+    ]
+    assert all(sub["body"].signature is None for sub in user_user2_threshold.subconditions)
+
+
+def test_delegate_signing_async(user_input, user_output, user_priv):
+    import asyncio
+    from transactions.common.crypto import Keyring
+
+    keyring = Keyring([user_priv])
+    inputs = [Input(user_input.fulfillment, user_input.owners_before, TransactionLink("a" * 64, i)) for i in range(6)]
+    in_flight = []
+
+    async def remote_signer(input_dict, message):
+        in_flight.append(1)
+        assert len(in_flight) <= 2
+        await asyncio.sleep(0.001)
+        in_flight.pop()
+        return keyring(input_dict, message)
+
+    def transfer():
+        return Transfer(Transfer.OPERATION, [{"id": "b" * 64}], deepcopy(inputs), [user_output])
+
+    expected = transfer().delegate_signing(keyring)
+    tx = asyncio.run(transfer().delegate_signing_async(remote_signer, max_concurrency=2))
+    assert tx.to_dict() == expected.to_dict()
+
+    tx = asyncio.run(transfer().delegate_signing_async(keyring))
+    assert tx.to_dict() == expected.to_dict()
+
+
+def test_delegate_signing_async_timeout(utx, user_priv):
+    import asyncio
+    from transactions.common.crypto import Keyring
+
+    async def slow_signer(input_dict, message):
+        await asyncio.sleep(1)
+        return Keyring([user_priv])(input_dict, message)
+
+    with raises(asyncio.TimeoutError):
+        asyncio.run(utx.delegate_signing_async(slow_signer, timeout=0.01))
+    assert all(input_.fulfillment.signature is None for input_ in utx.inputs)
+
+
+def test_serialize_transaction_fragments(signed_2_0_transfer_tx):
+    from transactions.common.crypto import hash_data
+    from transactions.common.utils import serialize_transaction, serialize_transaction_fragments, splice_fulfillments
+
+    tx_dict = signed_2_0_transfer_tx
+    fragments = serialize_transaction_fragments(tx_dict)
+    fulfillments = [input_["fulfillment"] for input_ in tx_dict["inputs"]]
+
+    assert len(fragments) == len(tx_dict["inputs"]) + 1
+    assert "null".join(fragments) == serialize_transaction(tx_dict, strip_id=True)
+    assert hash_data(splice_fulfillments(fragments, fulfillments)) == tx_dict["id"]
+    with raises(ValueError):
+        splice_fulfillments(fragments, [])
+
+
+def test_sign_twice_computes_valid_id(utx, user_priv, user2_pub):
+    tx = utx.sign([user_priv])
+    tx.add_output(Output.generate([user2_pub], 1))
+    tx.sign([user_priv])
+
+    assert Transaction.validate_id(tx.to_dict())
+
+
+@mark.parametrize(
+    "script_validation,calls_on_load,calls_on_inputs_valid",
+    [("eager", 1, 1), ("deferred", 0, 1), ("trusted", 0, 0)],
+)
+def test_script_validation_policy(
+    zenroom, user_pub, user_priv, script_validation, calls_on_load, calls_on_inputs_valid
+):
+    from transactions.common.memoize import from_dict, script_results
+    from transactions.common.script import Script
+
+    script = Script("Then print the string 'ok'", {"houses": []}, ["ok"])
+    tx = Create.generate([user_pub], [([user_pub], 1)], script=script).sign([user_priv])
+    tx_dict = tx.to_dict()
+    script_results.clear()
+    from_dict.clear()
+    zenroom.calls = 0
+
+    loaded = Transaction.from_dict(tx_dict, script_validation=script_validation)
+    assert zenroom.calls == calls_on_load
+    assert loaded.inputs_valid()
+    assert zenroom.calls == calls_on_inputs_valid
+
+    script_results.clear()
+    assert loaded.validate_script()
+    assert zenroom.calls == calls_on_inputs_valid + 1
+
+
+def test_deferred_invalid_script(zenroom, user_pub, user_priv):
+    from transactions.common.memoize import from_dict, script_results
+    from transactions.common.script import Script
+
+    script = Script("Then print the string 'ok'", {"houses": []}, ["not ok"])
+    zenroom.output = '{"output": ["not ok"]}'
+    tx = Create.generate([user_pub], [([user_pub], 1)], script=script).sign([user_priv])
+    tx_dict = tx.to_dict()
+    from_dict.clear()
+    script_results.clear()
+    zenroom.output = '{"output": ["ok"]}'
+
+    with raises(ValueError):
+        Transaction.from_dict(tx_dict)
+    loaded = Transaction.from_dict(tx_dict, script_validation="deferred")
+    with raises(ValueError):
+        loaded.inputs_valid()
+    assert Transaction.from_dict(tx_dict, script_validation="trusted").inputs_valid()
+
+    with raises(ValueError):
+        Transaction.from_dict(tx_dict, script_validation="lazy")
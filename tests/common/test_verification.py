@@ -0,0 +1,91 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# Planetmint and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+from pytest import raises
+
+from transactions.common.transaction import Transaction
+from transactions.common.verification import (
+    BatchVerifier,
+    verify_transactions,
+    CONDITION_MISMATCH,
+    INVALID_FULFILLMENT,
+    INVALID_SIGNATURE,
+)
+from transactions.types.assets.transfer import Transfer
+
+
+def test_verify_valid_transactions(signed_create_tx, signed_transfer_tx):
+    assert verify_transactions([signed_create_tx, signed_transfer_tx], [None, signed_create_tx.outputs]) == []
+
+
+def test_verify_threshold_transaction(user_user2_threshold_input, user_user2_threshold_output, user_priv, user2_priv):
+    tx = Transaction(
+        Transaction.CREATE, [{"data": None}], [user_user2_threshold_input], [user_user2_threshold_output]
+    ).sign([user_priv, user2_priv])
+
+    assert tx.inputs_valid() is True
+    assert verify_transactions([tx]) == []
+
+
+def test_verify_reports_invalid_signature(signed_create_tx, signed_transfer_tx, user_pk, user_sk):
+    inputs = signed_create_tx.to_inputs()
+    tampered = Transfer.generate(inputs, [([user_pk], 1)], asset_ids=[signed_create_tx.id]).sign([user_sk])
+    tampered.inputs[0].fulfillment.signature = bytes(64)
+
+    verifier = BatchVerifier()
+    verifier.add(signed_create_tx)
+    verifier.add(signed_transfer_tx, signed_create_tx.outputs)
+    verifier.add(tampered, signed_create_tx.outputs)
+    failures = verifier.verify()
+
+    assert len(verifier) == 3
+    assert len(failures) == 1
+    assert failures[0].transaction_index == 2
+    assert failures[0].transaction_id == tampered.id
+    assert failures[0].input_index == 0
+    assert failures[0].reason == INVALID_SIGNATURE
+    assert tampered.inputs_valid(signed_create_tx.outputs) is False
+
+
+def test_verify_reports_condition_mismatch(signed_transfer_tx, user2_output):
+    failures = verify_transactions([signed_transfer_tx], [[user2_output]])
+    assert [(f.input_index, f.reason) for f in failures] == [(0, CONDITION_MISMATCH)]
+
+
+def test_verify_reports_unsigned_input(utx):
+    failures = verify_transactions([utx])
+    assert [(f.input_index, f.reason) for f in failures] == [(0, INVALID_FULFILLMENT)]
+
+
+def test_verify_with_invalid_parameters(signed_transfer_tx):
+    with raises(ValueError):
+        verify_transactions([signed_transfer_tx], [[]])
+    with raises(ValueError):
+        verify_transactions([signed_transfer_tx], [])
+
+
+def test_validate_many(signed_create_tx, signed_transfer_tx):
+    from transactions.common.exceptions import InvalidHash
+    from transactions.common.verification import validate_many
+
+    invalid_tx = signed_create_tx.to_dict().copy()
+    invalid_tx["id"] = "a" * 64
+    tx_dicts = [signed_create_tx.to_dict(), signed_transfer_tx.to_dict(), invalid_tx]
+    outputs = [None, [output.to_dict() for output in signed_create_tx.outputs], None]
+
+    results = validate_many(tx_dicts, workers=2, outputs=outputs, chunksize=1)
+
+    assert [result.transaction_id for result in results] == [signed_create_tx.id, signed_transfer_tx.id, "a" * 64]
+    assert [result.valid for result in results] == [True, True, False]
+    assert results[2].error is InvalidHash
+    assert validate_many(tx_dicts, workers=1, outputs=outputs) == results
+
+
+def test_validate_many_reports_invalid_signature(signed_transfer_tx, user2_output):
+    from transactions.common.exceptions import InvalidSignature
+    from transactions.common.verification import validate_many
+
+    (result,) = validate_many([signed_transfer_tx.to_dict()], outputs=[[user2_output.to_dict()]])
+    assert result == (signed_transfer_tx.id, False, InvalidSignature)
@@ -33,6 +33,16 @@ ASSET_DEFINITION = [{"data": "QmaozNR7DZHQK1ZcU9p7QdrshMvXqWK6gpu5rmrkPdT3L4"}]
 DATA = "QmaozNR7DZHQK1ZcU9p7QdrshMvXqWK6gpu5rmrkPdT3L4"
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    from transactions.common.memoize import clear_caches
+
+    # NOTE: The memoization caches are shared by the whole process, so every
+    #       test starts without entries and statistics
+    clear_caches()
+    yield
+
+
 @pytest.fixture
 def user_priv():
     return USER_PRIVATE_KEY
@@ -484,3 +494,34 @@ def signed_2_0_transfer_tx():
         "version": "2.0",
         "id": "6b569a4c4e7a97ea4c3b8ef072620d8f6131c1929e2058cc484f003c9459baf4",
     }
+
+
+class FakeZenroom:
+    def __init__(self, output='{"output": ["ok"]}', delay=None):
+        from threading import Event, Lock
+
+        self.output = output
+        self.calls = 0
+        self.delay = delay
+        self.release = Event()
+        self.lock = Lock()
+
+    def __call__(self, code, data=None):
+        from zenroom.zenroom import ZenResult
+
+        with self.lock:
+            self.calls += 1
+        if self.delay:
+            self.release.wait(self.delay)
+        return ZenResult(self.output, "")
+
+
+@pytest.fixture
+def zenroom(monkeypatch):
+    from transactions.common.memoize import script_results
+
+    script_results.clear()
+    fake = FakeZenroom()
+    monkeypatch.setattr("transactions.common.script.zencode_exec", fake)
+    yield fake
+    script_results.clear()
@@ -0,0 +1,40 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# Planetmint and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+import json
+
+from benchmarks import suite  # noqa: F401
+from benchmarks.runner import BASELINE, Result, compare, get_benchmarks, measure, to_json
+from transactions.common.memoize import get_cache
+
+
+def test_measure_benchmark():
+    (benchmark,) = get_benchmarks(["to_dict/inputs=10/memo=off"])
+    result = measure(benchmark, min_time=0.001, repeat=1)
+
+    assert result.name == benchmark.name
+    assert result.ops_per_sec > 0
+    assert result.peak_bytes > 0
+    assert get_cache("to_dict").enabled
+
+
+def test_compare_with_baseline():
+    baseline = to_json([Result("a", 100.0, 1000, 0), Result("b", 100.0, 100000, 0)])
+    results = [Result("a", 79.0, 1000, 0), Result("b", 99.0, 130000, 0), Result("c", 1.0, 1, 0)]
+
+    regressions = compare(results, baseline, tolerance=0.2)
+    assert [(regression.name, regression.metric) for regression in regressions] == [
+        ("a", "ops_per_sec"),
+        ("b", "peak_bytes"),
+    ]
+
+
+def test_baseline_covers_benchmarks():
+    with open(BASELINE) as baseline_file:
+        baseline = json.load(baseline_file)
+
+    # NOTE: `script/validate` needs the `zencode-exec` binary
+    names = {benchmark.name for benchmark in get_benchmarks()} - {"script/validate"}
+    assert names <= set(baseline["results"])
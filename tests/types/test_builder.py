@@ -0,0 +1,73 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# Planetmint and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+from transactions.types.assets.builder import TransactionBuilder
+from transactions.types.assets.create import Create
+from transactions.types.assets.transfer import Transfer
+from transactions.common.transaction import Transaction
+from transactions.common.schema import validate_transaction_schema
+from pytest import raises
+
+
+def test_builder_create_matches_generate(user_pub, user_priv, user2_pub):
+    recipients = [([user_pub], 1), ([user_pub, user2_pub], 2)]
+    expected = Create.generate([user_pub], recipients).sign([user_priv])
+
+    tx = TransactionBuilder([user_priv]).create([user_pub], recipients)
+    assert tx.to_dict() == expected.to_dict()
+    assert tx.inputs_valid()
+
+
+def test_builder_transfer(user_pub, user_priv, user2_pub, user2_priv):
+    builder = TransactionBuilder([user_priv, user2_priv])
+    create_tx = builder.create([user_pub], [([user_pub], 2)])
+    inputs = create_tx.to_inputs()
+
+    tx = builder.transfer(inputs, [([user2_pub], 1), ([user_pub], 1)], [create_tx.id])
+    expected = Transfer.generate(create_tx.to_inputs(), [([user2_pub], 1), ([user_pub], 1)], [create_tx.id])
+    assert tx.to_dict() == expected.sign([user_priv]).to_dict()
+    assert tx.inputs_valid(create_tx.outputs)
+    assert inputs[0].fulfillment.signature is None
+
+
+def test_builder_reuses_output_templates(user_pub, user_priv, user2_pub):
+    builder = TransactionBuilder([user_priv])
+    first = builder.create([user_pub], [([user2_pub], 1)])
+    second = builder.create([user_pub], [([user2_pub], 5)])
+
+    assert first.outputs[0].fulfillment is second.outputs[0].fulfillment
+    assert second.outputs[0].amount == 5
+    assert first.inputs[0].fulfillment is not second.inputs[0].fulfillment
+
+
+def test_builder_streams_dicts(user_pub, user_priv, user2_pub):
+    consumed = []
+
+    def specs():
+        for amount in range(1, 4):
+            consumed.append(amount)
+            yield {"tx_signers": [user_pub], "recipients": [([user2_pub], amount)]}
+
+    stream = TransactionBuilder([user_priv]).create_many(specs())
+    first = next(stream)
+    assert consumed == [1]
+
+    tx_dicts = [first, *stream]
+    assert [tx_dict["outputs"][0]["amount"] for tx_dict in tx_dicts] == ["1", "2", "3"]
+    for tx_dict in tx_dicts:
+        validate_transaction_schema(tx_dict)
+        assert Transaction.from_dict(tx_dict, skip_schema_validation=False).inputs_valid()
+
+
+def test_builder_invalid_params(user_pub, user_priv):
+    builder = TransactionBuilder([user_priv])
+    with raises(TypeError):
+        TransactionBuilder(user_priv)
+    with raises(ValueError):
+        builder.create([user_pub], [])
+    with raises(ValueError):
+        builder.transfer([], [([user_pub], 1)], ["a" * 64])
+    with raises(TypeError):
+        builder.create([user_pub], [([user_pub], "1")])
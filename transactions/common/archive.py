@@ -0,0 +1,282 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# Planetmint and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""Append-only transaction archives with random access by id.
+
+An archive consists of two files:
+
+- the data file at `path`, holding the canonical JSON of one transaction
+  per line. It is a regular NDJSON dump, see
+  :func:`~transactions.common.ndjson.read_transactions`.
+- the index at `path` + ``".idx"``: a 24 byte header (the magic bytes
+  ``PMTXIDX1``, the number of records and the size of the data file, both
+  as little-endian uint64) followed by one 44 byte record per transaction,
+  sorted by id: the 32 byte id, the offset (uint64) and the length (uint32)
+  of its line in the data file.
+
+Both files are memory-mapped by :class:`Archive`. Transaction ids are
+hashes and thus uniformly distributed, so a lookup interpolates the
+position of an id in the index and usually touches a single page of it,
+followed by one slice of the data file.
+"""
+import mmap
+import os
+import struct
+from operator import itemgetter
+from typing import Iterator, Optional, Union
+
+from transactions.common.transaction import SCRIPT_EAGER, Transaction
+from transactions.common.utils import deserialize, serialize
+
+INDEX_SUFFIX = ".idx"
+
+_MAGIC = b"PMTXIDX1"
+_HEADER = struct.Struct("<8sQQ")
+_ENTRY = struct.Struct("<32sQI")
+_ID_SIZE = 32
+
+
+def _id_bytes(tx_id: str) -> bytes:
+    """Returns the 32 bytes of the hex encoded id `tx_id`.
+
+    Raises:
+        ValueError: If `tx_id` is not a hex encoded 32 byte hash.
+    """
+    try:
+        id_bytes = bytes.fromhex(tx_id)
+    except (TypeError, ValueError):
+        id_bytes = b""
+    if len(id_bytes) != _ID_SIZE:
+        raise ValueError("{!r} is not a transaction id".format(tx_id))
+    return id_bytes
+
+
+class ArchiveWriter(object):
+    """Writes a new archive, see :mod:`transactions.common.archive`.
+
+    The index is written when the writer is closed, until then the archive
+    can't be opened. A transaction appended more than once is only indexed
+    once, lookups return the copy that was appended first.
+
+    Note:
+        The writer keeps the id, offset and length of every transaction
+        in memory to sort the index.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        """Create an :class:`~.ArchiveWriter`, replacing any archive at
+        `path`.
+
+        Args:
+            path (str): The path of the data file.
+        """
+        self.path = os.fspath(path)
+        # NOTE: The index of a replaced archive must not outlive its data,
+        #       even if writing the new archive fails
+        try:
+            os.remove(self.path + INDEX_SUFFIX)
+        except FileNotFoundError:
+            pass
+        self._data = open(self.path, "wb")
+        self._offset = 0
+        self._entries = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        if exc_type is None:
+            self.close()
+        else:
+            # NOTE: Without an index, the partially written archive can't
+            #       be mistaken for a complete one
+            self._data.close()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def append(self, tx: Union[Transaction, dict]) -> None:
+        """Appends a Transaction or transaction dict to the archive.
+
+        Raises:
+            ValueError: If the id of `tx` is not a hex encoded 32 byte hash.
+        """
+        tx_dict = tx.to_dict() if isinstance(tx, Transaction) else tx
+        id_bytes = _id_bytes(tx_dict["id"])
+        record = serialize(tx_dict).encode() + b"\n"
+        self._data.write(record)
+        self._entries.append((id_bytes, self._offset, len(record) - 1))
+        self._offset += len(record)
+
+    def extend(self, transactions) -> None:
+        for tx in transactions:
+            self.append(tx)
+
+    def close(self) -> None:
+        """Flushes the data file and writes the index."""
+        if self._data.closed:
+            return
+        self._data.close()
+        # NOTE: Only the id is meaningful for ordering. The sort is stable,
+        #       so the first entry of every id is the first one appended
+        entries, previous = [], None
+        for entry in sorted(self._entries, key=itemgetter(0)):
+            if entry[0] != previous:
+                entries.append(entry)
+                previous = entry[0]
+        self._entries = entries
+
+        index_path = self.path + INDEX_SUFFIX
+        with open(index_path + ".tmp", "wb") as index:
+            index.write(_HEADER.pack(_MAGIC, len(entries), self._offset))
+            index.write(b"".join(_ENTRY.pack(*entry) for entry in entries))
+        os.replace(index_path + ".tmp", index_path)
+
+
+def _map(file) -> Union[mmap.mmap, bytes]:
+    # NOTE: Empty files can't be mapped
+    if os.fstat(file.fileno()).st_size == 0:
+        return b""
+    return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class Archive(object):
+    """A read-only, memory-mapped archive, see
+    :mod:`transactions.common.archive`.
+
+    Transactions are looked up by id like in a mapping, and are returned
+    lazily parsed, see :meth:`~.Transaction.from_dict`.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        """Open the archive at `path`.
+
+        Args:
+            path (str): The path of the data file.
+
+        Raises:
+            ValueError: If the index is corrupt or doesn't belong to the
+                data file.
+        """
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as data, open(self.path + INDEX_SUFFIX, "rb") as index:
+            self._data = _map(data)
+            self._index = _map(index)
+
+        try:
+            magic, self._size, data_size = _HEADER.unpack_from(self._index)
+        except struct.error:
+            magic = None
+        if (
+            magic != _MAGIC
+            or len(self._index) != _HEADER.size + self._size * _ENTRY.size
+            or len(self._data) != data_size
+        ):
+            self.close()
+            raise ValueError("{} is not a valid archive index".format(self.path + INDEX_SUFFIX))
+        self._view = memoryview(self._data)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        view = getattr(self, "_view", None)
+        if view is not None:
+            view.release()
+        for mapped in (self._data, self._index):
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, tx_id: str) -> bool:
+        try:
+            return self._find(_id_bytes(tx_id)) is not None
+        except ValueError:
+            return False
+
+    def __iter__(self) -> Iterator[str]:
+        """Yields the ids of all transactions, in order."""
+        for position in range(self._size):
+            yield self._id_at(position).hex()
+
+    def __getitem__(self, tx_id: str) -> Transaction:
+        tx = self.get(tx_id)
+        if tx is None:
+            raise KeyError(tx_id)
+        return tx
+
+    def _id_at(self, position: int) -> bytes:
+        start = _HEADER.size + position * _ENTRY.size
+        return self._index[start : start + _ID_SIZE]
+
+    def _find(self, id_bytes: bytes) -> Optional[tuple[int, int]]:
+        """Returns the offset and length of the transaction with the id
+        `id_bytes`, or None.
+        """
+        key = int.from_bytes(id_bytes, "big")
+        low, high = 0, self._size - 1
+        interpolate = True
+        while low <= high:
+            low_key = int.from_bytes(self._id_at(low), "big")
+            high_key = int.from_bytes(self._id_at(high), "big")
+            if key < low_key or key > high_key:
+                return None
+            # NOTE: Interpolation finds uniformly distributed ids in a few
+            #       steps, alternating with bisection bounds the worst case
+            if interpolate and high_key != low_key:
+                position = low + (key - low_key) * (high - low) // (high_key - low_key)
+            else:
+                position = (low + high) // 2
+            interpolate = not interpolate
+
+            found = int.from_bytes(self._id_at(position), "big")
+            if found == key:
+                _, offset, length = _ENTRY.unpack_from(self._index, _HEADER.size + position * _ENTRY.size)
+                return offset, length
+            if found < key:
+                low = position + 1
+            else:
+                high = position - 1
+        return None
+
+    def read(self, tx_id: str) -> Optional[memoryview]:
+        """Returns the canonical JSON of a transaction without copying it.
+
+        The view must be released before the archive is closed.
+
+        Raises:
+            ValueError: If `tx_id` is not a hex encoded 32 byte hash.
+        """
+        found = self._find(_id_bytes(tx_id))
+        if found is None:
+            return None
+        offset, length = found
+        return self._view[offset : offset + length]
+
+    def get(self, tx_id: str, validate: bool = False, script_validation: str = SCRIPT_EAGER) -> Optional[Transaction]:
+        """Returns a lazily parsed transaction, or None if it's not archived.
+
+        Args:
+            tx_id (str): The id of the transaction.
+            validate (bool): Validate the schema and id of the transaction.
+            script_validation (str): When to validate the script, see
+                :class:`~.Transaction`.
+
+        Raises:
+            ValueError: If `tx_id` is not a hex encoded 32 byte hash.
+        """
+        record = self.read(tx_id)
+        if record is None:
+            return None
+        with record:
+            tx = deserialize(record.tobytes())
+        return Transaction.from_dict(
+            tx, skip_schema_validation=not validate, lazy=True, script_validation=script_validation
+        )
@@ -6,6 +6,7 @@
 # Separate all crypto code so that we can easily test several implementations
 from collections import namedtuple
 from hashlib import sha3_256
+from typing import Iterable, Optional
 from planetmint_cryptoconditions import crypto
 
 
@@ -35,6 +36,73 @@ PrivateKey = crypto.Ed25519SigningKey
 PublicKey = crypto.Ed25519VerifyingKey
 
 
+class Keyring(object):
+    """Ed25519 private keys indexed by their base58 encoded public key.
+
+    Every key is decoded and its public key derived once when it is added,
+    so a Keyring can be reused to sign any number of Transactions, see
+    :meth:`~transactions.common.transaction.Transaction.sign`. A Keyring is
+    also a valid callback for :meth:`~transactions.common.transaction.
+    Transaction.delegate_signing`.
+    """
+
+    def __init__(self, private_keys: Optional[Iterable[str]] = None):
+        """Create a :class:`~.Keyring`.
+
+        Args:
+            private_keys (:obj:`list` of :obj:`str`, optional): base58
+                encoded private keys to add.
+        """
+        self._private_keys = {}
+        self._public_keys = {}
+        for private_key in private_keys or ():
+            self.add(private_key)
+
+    def add(self, private_key: str) -> str:
+        """Adds a base58 encoded private key.
+
+        Returns:
+            str: The base58 encoded public key of `private_key`.
+        """
+        signing_key = PrivateKey(private_key)
+        public_key = signing_key.get_verifying_key().encode().decode()
+        self._private_keys[public_key] = signing_key
+        self._public_keys[public_key] = signing_key.verify_key.encode()
+        return public_key
+
+    def __getitem__(self, public_key: str) -> PrivateKey:
+        return self._private_keys[public_key]
+
+    def __contains__(self, public_key: str) -> bool:
+        return public_key in self._private_keys
+
+    def __len__(self):
+        return len(self._private_keys)
+
+    @property
+    def public_keys(self) -> list[str]:
+        return list(self._private_keys)
+
+    def raw_public_key(self, public_key: str) -> bytes:
+        """Returns the decoded `public_key` of a private key in the Keyring."""
+        return self._public_keys[public_key]
+
+    def sign(self, public_key: str, message: bytes) -> bytes:
+        """Signs `message` with the private key of `public_key`.
+
+        Returns:
+            bytes: The raw signature.
+
+        Raises:
+            KeyError: If the Keyring holds no private key for `public_key`.
+        """
+        return self._private_keys[public_key].sign(message, encoding="bytes")
+
+    def __call__(self, input_: dict, message: bytes) -> bytes:
+        # NOTE: Callback protocol of `Transaction.delegate_signing`
+        return self.sign(input_["owners_before"][0], message)
+
+
 def key_pair_from_ed25519_key(hex_private_key):
     """Generate base58 encode public-private key pair from a hex encoded private key"""
     priv_key = crypto.Ed25519SigningKey(bytes.fromhex(hex_private_key)[:32], encoding="bytes")
@@ -49,3 +117,32 @@ def public_key_from_ed25519_key(hex_public_key):
     """Generate base58 public key from hex encoded public key"""
     public_key = crypto.Ed25519VerifyingKey(bytes.fromhex(hex_public_key), encoding="bytes")
     return public_key.encode(encoding="base58").decode("utf-8")
+
+
+def verify_ed25519_signatures(checks) -> list[bool]:
+    """Verify many Ed25519 signatures in a single pass.
+
+    Verifying keys are decoded once per distinct public key and repeated
+    (public key, message, signature) triples are only checked once.
+
+    Args:
+        checks (iterable): ``(public_key, message, signature)`` triples,
+            all given as raw bytes.
+
+    Returns:
+        :obj:`list` of bool: The verification result for each triple, in
+        the order they were given.
+    """
+    verifying_keys = {}
+    verified = {}
+    results = []
+    for check in checks:
+        if check not in verified:
+            public_key, message, signature = check
+            try:
+                verifying_key = verifying_keys[public_key]
+            except KeyError:
+                verifying_key = verifying_keys[public_key] = PublicKey(public_key, encoding="bytes")
+            verified[check] = verifying_key.verify(message, signature, encoding="bytes")
+        results.append(verified[check])
+    return results
@@ -120,3 +120,20 @@ class InvalidPowerChange(ValidationError):
 
 class InvalidPublicKey(ValidationError):
     """Raised if public key doesn't match the encoding type"""
+
+
+class ScriptTimeout(ValidationError):
+    """Raised if a script didn't finish executing in time"""
+
+
+class InvalidScript(ValidationError, ValueError):
+    """Raised if the script of a transaction doesn't produce its outputs"""
+
+
+class InvalidRecord(ValidationError):
+    """Raised if a record of a transaction dump is not a valid transaction"""
+
+    def __init__(self, line: int, error: Exception):
+        super().__init__("line {}: {}".format(line, error))
+        self.line = line
+        self.error = error
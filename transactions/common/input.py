@@ -3,8 +3,8 @@
 # SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
 # Code is Apache-2.0 and docs are CC-BY-4.0
 
-from typing import Optional
-from planetmint_cryptoconditions import Fulfillment
+from typing import Optional, Union
+from planetmint_cryptoconditions import Ed25519Sha256, Fulfillment
 from planetmint_cryptoconditions.exceptions import ASN1DecodeError, ASN1EncodeError
 
 from transactions.common.exceptions import InvalidSignature
@@ -28,6 +28,8 @@ class Input(object):
                 Transaction.
     """
 
+    __slots__ = ("fulfillment", "fulfills", "owners_before")
+
     def __init__(self, fulfillment: Fulfillment, owners_before: list[str], fulfills: Optional[TransactionLink] = None):
         """Create an instance of an :class:`~.Input`.
 
@@ -50,13 +52,36 @@ class Input(object):
         self.owners_before = owners_before
 
     def __eq__(self, other):
-        # TODO: If `other !== Fulfillment` return `False`
-        return self.to_dict() == other.to_dict()
+        if not isinstance(other, Input):
+            return NotImplemented
+        # NOTE: The fulfillment is signed in place, so it is serialized for
+        #       comparison last, and only if everything else is equal.
+        return (
+            self._fulfills_key() == other._fulfills_key()
+            and self.owners_before == other.owners_before
+            and self._fulfillment_key() == other._fulfillment_key()
+        )
 
-    # NOTE: This function is used to provide a unique key for a given
-    # Input to suppliment memoization
     def __hash__(self):
-        return hash((self.fulfillment, self.fulfills))
+        return hash((tuple(self.owners_before), self._fulfills_key()))
+
+    def _fulfills_key(self) -> tuple:
+        if self.fulfills is None:
+            return (None, None)
+        return (self.fulfills.txid, self.fulfills.output)
+
+    def _fulfillment_key(self) -> Union[tuple, str, dict]:
+        # NOTE: The URI of an Ed25519 fulfillment encodes nothing but its
+        #       public key and signature
+        if isinstance(self.fulfillment, Ed25519Sha256):
+            return (self.fulfillment.public_key, self.fulfillment.signature)
+        return self._serialize_fulfillment()
+
+    def _serialize_fulfillment(self) -> Union[str, dict]:
+        try:
+            return self.fulfillment.serialize_uri()
+        except (TypeError, AttributeError, ASN1EncodeError, ASN1DecodeError):
+            return _fulfillment_to_details(self.fulfillment)
 
     def to_dict(self):
         """Transforms the object to a Python dictionary.
@@ -68,11 +93,9 @@ class Input(object):
         Returns:
             dict: The Input as an alternative serialization format.
         """
-        try:
-            fulfillment = self.fulfillment.serialize_uri()
-        except (TypeError, AttributeError, ASN1EncodeError, ASN1DecodeError):
-            fulfillment = _fulfillment_to_details(self.fulfillment)
+        return self._to_dict(self._serialize_fulfillment())
 
+    def _to_dict(self, fulfillment: Union[str, dict, None]) -> dict:
         try:
             # NOTE: `self.fulfills` can be `None` and that's fine
             fulfills = self.fulfills.to_dict()
@@ -0,0 +1,204 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# Planetmint and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""Optional timing spans and counters for the hot paths.
+
+Instrumentation is disabled by default and every hook is a no-op until a
+sink is installed with :func:`set_sink`. A sink is either a callback or an
+object with `span(name, seconds)` and `count(name, value)` methods, like
+:class:`MetricsRegistry`.
+
+Spans:
+    - `transaction.from_dict`
+    - `transaction.validate_schema`
+    - `transaction.validate_id`
+    - `transaction.sign`
+    - `transaction.input_valid`, with the nested `fulfillment.parse` and
+      `fulfillment.verify`
+    - `script.validate`
+
+Counters:
+    - `transaction.to_dict.cache_hits`, `transaction.to_dict.cache_misses`
+    - `transaction.verification.cache_hits`,
+      `transaction.verification.cache_misses`
+"""
+
+import functools
+import threading
+from bisect import bisect_left
+from time import perf_counter
+from typing import Callable, Optional
+
+_sink = None
+
+
+class _NoopSpan(object):
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span(object):
+    __slots__ = ("name", "sink", "start")
+
+    def __init__(self, name: str, sink):
+        self.name = name
+        self.sink = sink
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.sink.span(self.name, perf_counter() - self.start)
+        return False
+
+
+class CallbackSink(object):
+    """Passes every measurement to `callback(kind, name, value)`, where
+    `kind` is ``"span"`` (`value` in seconds) or ``"count"``.
+    """
+
+    def __init__(self, callback: Callable[[str, str, float], None]):
+        self.callback = callback
+
+    def span(self, name: str, seconds: float) -> None:
+        self.callback("span", name, seconds)
+
+    def count(self, name: str, value: int = 1) -> None:
+        self.callback("count", name, value)
+
+
+# NOTE: Upper bounds in seconds, from 10 microseconds to one second
+DEFAULT_BUCKETS = (1e-05, 5e-05, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+
+class MetricsRegistry(object):
+    """A thread-safe, in-memory registry of histograms and counters in the
+    style of Prometheus.
+    """
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._spans = {}
+        self._counters = {}
+
+    def span(self, name: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._spans.get(name)
+            if histogram is None:
+                # NOTE: count, sum, max and one count per bucket plus +Inf
+                histogram = self._spans[name] = [0, 0.0, 0.0, [0] * (len(self.buckets) + 1)]
+            histogram[0] += 1
+            histogram[1] += seconds
+            histogram[2] = max(histogram[2], seconds)
+            histogram[3][bisect_left(self.buckets, seconds)] += 1
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._spans.clear()
+            self._counters.clear()
+
+    def snapshot(self) -> dict:
+        """Returns all spans and counters.
+
+        Returns:
+            dict: The spans by name, each with its `count`, `sum` and `max`
+            in seconds and the cumulative `buckets` by upper bound, and the
+            counters by name.
+        """
+        with self._lock:
+            spans = {}
+            for name, (count, total, maximum, bucket_counts) in self._spans.items():
+                cumulative, buckets = 0, {}
+                for bound, bucket_count in zip(self.buckets + (float("inf"),), bucket_counts):
+                    cumulative += bucket_count
+                    buckets[bound] = cumulative
+                spans[name] = {"count": count, "sum": total, "max": maximum, "buckets": buckets}
+            return {"spans": spans, "counters": dict(self._counters)}
+
+    def render(self) -> str:
+        """Returns all spans and counters in the Prometheus text format."""
+        snapshot = self.snapshot()
+        lines = ["# TYPE transactions_span_seconds histogram"]
+        for name, span in sorted(snapshot["spans"].items()):
+            for bound, count in span["buckets"].items():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append('transactions_span_seconds_bucket{{span="{}",le="{}"}} {}'.format(name, le, count))
+            lines.append('transactions_span_seconds_sum{{span="{}"}} {!r}'.format(name, span["sum"]))
+            lines.append('transactions_span_seconds_count{{span="{}"}} {}'.format(name, span["count"]))
+        lines.append("# TYPE transactions_events_total counter")
+        for name, value in sorted(snapshot["counters"].items()):
+            lines.append('transactions_events_total{{event="{}"}} {}'.format(name, value))
+        return "\n".join(lines) + "\n"
+
+
+def set_sink(sink) -> Optional[object]:
+    """Enables instrumentation, or disables it if `sink` is None.
+
+    Args:
+        sink: A callback, see :class:`CallbackSink`, or an object with
+            `span(name, seconds)` and `count(name, value)` methods, like
+            :class:`MetricsRegistry`.
+
+    Returns:
+        The previous sink.
+    """
+    global _sink
+    if sink is not None and not hasattr(sink, "span") and callable(sink):
+        sink = CallbackSink(sink)
+    previous, _sink = _sink, sink
+    return previous
+
+
+def get_sink() -> Optional[object]:
+    return _sink
+
+
+def span(name: str):
+    """Returns a context manager timing its block as span `name`."""
+    sink = _sink
+    if sink is None:
+        return _NOOP_SPAN
+    return _Span(name, sink)
+
+
+def count(name: str, value: int = 1) -> None:
+    """Increments counter `name` by `value`."""
+    sink = _sink
+    if sink is not None:
+        sink.count(name, value)
+
+
+def timed(name: str) -> Callable:
+    """Decorates a function to time every call as span `name`."""
+
+    def decorate(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def timed_func(*args, **kwargs):
+            sink = _sink
+            if sink is None:
+                return func(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                sink.span(name, perf_counter() - start)
+
+        return timed_func
+
+    return decorate
@@ -1,7 +1,235 @@
 import functools
 import codecs
-from functools import lru_cache
-from typing import Callable
+import sys
+from copy import deepcopy
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Hashable, Optional
+
+from transactions.common.instrumentation import count
+
+CacheInfo = namedtuple("CacheInfo", ("hits", "misses", "evictions", "maxsize", "currsize", "bytes"))
+
+_MISSING = object()
+
+
+def approximate_size(obj: Any) -> int:
+    """Approximates the memory used by a JSON-like object in bytes."""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(approximate_size(key) + approximate_size(value) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(approximate_size(item) for item in obj)
+    return size
+
+
+class LRUCache(object):
+    """A thread-safe, bounded least-recently-used cache.
+
+    Entries are evicted once more than `maxsize` entries are stored or, if a
+    `sizeof` function is given, once the entries take up more than
+    `max_bytes`. If `ttl` is set, entries expire `ttl` seconds after they
+    were stored. Hits, misses and evictions are counted and reported by
+    :meth:`cache_info`.
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = 16384,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[Hashable, Any], int]] = None,
+        timer: Callable = time.monotonic,
+    ):
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+        self._timer = timer
+        self._sizeof = sizeof
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.enabled = True
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key: Hashable, default=None):
+        with self._lock:
+            try:
+                value, expires, _ = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            if expires is not None and expires <= self._timer():
+                self._remove(key)
+                self.evictions += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value) -> None:
+        if not self.enabled or self.maxsize == 0:
+            return
+        size = self._sizeof(key, value) if self._sizeof else 0
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            expires = self._timer() + self.ttl if self.ttl is not None else None
+            self._data[key] = (value, expires, size)
+            self.bytes += size
+            self._evict()
+
+    def configure(
+        self,
+        maxsize: Optional[int] = _MISSING,
+        ttl: Optional[float] = _MISSING,
+        max_bytes: Optional[int] = _MISSING,
+        enabled: Optional[bool] = None,
+    ) -> None:
+        """Changes the limits of the cache. Entries that no longer fit are
+        evicted right away; a changed ttl only applies to new entries.
+        Disabling the cache drops all its entries.
+        """
+        with self._lock:
+            if maxsize is not _MISSING:
+                self.maxsize = maxsize
+            if ttl is not _MISSING:
+                self.ttl = ttl
+            if max_bytes is not _MISSING:
+                self.max_bytes = max_bytes
+            if enabled is not None:
+                self.enabled = enabled
+                if not enabled:
+                    self._data.clear()
+                    self.bytes = 0
+            self._evict()
+
+    def clear(self) -> None:
+        """Removes all entries and resets the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.bytes = self.hits = self.misses = self.evictions = 0
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._data), self.bytes)
+
+    def _remove(self, key):
+        _, _, size = self._data.pop(key)
+        self.bytes -= size
+
+    def _evict(self):
+        while self._data and (
+            (self.maxsize is not None and len(self._data) > self.maxsize)
+            or (self.max_bytes is not None and self.bytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self._data)))
+            self.evictions += 1
+
+
+_registry: dict[str, LRUCache] = {}
+
+
+def register_cache(name: str, cache: LRUCache) -> LRUCache:
+    """Makes a cache configurable and observable through
+    :func:`configure_cache` and :func:`cache_stats`.
+    """
+    _registry[name] = cache
+    return cache
+
+
+def get_cache(name: str) -> LRUCache:
+    return _registry[name]
+
+
+def configure_cache(name: str, **options) -> None:
+    """Configures a registered cache at runtime.
+
+    Args:
+        name (str): The name of the cache, e.g. `from_dict` or `to_dict`.
+        **options: Any of `maxsize`, `max_bytes`, `ttl` and `enabled`, see
+            :meth:`LRUCache.configure`.
+    """
+    get_cache(name).configure(**options)
+
+
+def cache_stats() -> dict[str, dict]:
+    """Returns the statistics of all registered caches keyed by name."""
+    return {name: cache.cache_info()._asdict() for name, cache in _registry.items()}
+
+
+def clear_caches() -> None:
+    """Removes the entries and resets the statistics of all registered
+    caches.
+    """
+    for cache in _registry.values():
+        cache.clear()
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError("memoized transaction dicts are read-only, use `copy.deepcopy` to get a mutable copy")
+
+
+class FrozenDict(dict):
+    """A read-only dict. Copying it returns a regular, mutable dict."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {key: deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class FrozenList(list):
+    """A read-only list. Copying it returns a regular, mutable list."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [deepcopy(item, memo) for item in self]
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def freeze(obj: Any) -> Any:
+    """Returns a read-only version of a JSON-like object."""
+    if isinstance(obj, dict):
+        return FrozenDict((key, freeze(value)) for key, value in obj.items())
+    if isinstance(obj, list):
+        return FrozenList(freeze(item) for item in obj)
+    return obj
+
+
+def thaw(obj: Any) -> Any:
+    """Returns a mutable copy of a JSON-like object. Only the containers are
+    copied, scalar values are shared.
+    """
+    if isinstance(obj, dict):
+        return {key: thaw(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [thaw(item) for item in obj]
+    return obj
 
 
 class HDict(dict):
@@ -9,9 +237,11 @@ class HDict(dict):
         return hash(codecs.decode(self["id"], "hex"))
 
 
-@lru_cache(maxsize=16384)
-def from_dict(func: Callable, *args, **kwargs):
-    return func(*args, **kwargs)
+# NOTE: A single entry can be a transaction with thousands of outputs, so the
+#       dict caches are bounded by their approximate size in memory.
+from_dict = register_cache(
+    "from_dict", LRUCache(maxsize=None, max_bytes=128 * 2**20, sizeof=lambda key, _: approximate_size(key[2]))
+)
 
 
 def memoize_from_dict(func: Callable):
@@ -19,39 +249,81 @@ def memoize_from_dict(func: Callable):
     def memoized_func(*args, **kwargs):
         if args[1] is None:
             return None
-        elif args[1].get("id", None):
+        elif args[1].get("id", None) and from_dict.enabled:
             args = list(args)
             args[1] = HDict(args[1])
             new_args = tuple(args)
-            return from_dict(func, *new_args, **kwargs)
+            key = (func, *new_args, *sorted(kwargs.items()))
+            result = from_dict.get(key, _MISSING)
+            if result is _MISSING:
+                result = func(*new_args, **kwargs)
+                from_dict.put(key, result)
+            return result
         else:
             return func(*args, **kwargs)
 
     return memoized_func
 
 
-class ToDictWrapper:
-    def __init__(self, tx):
-        self.tx = tx
+to_dict = register_cache(
+    "to_dict", LRUCache(maxsize=None, max_bytes=128 * 2**20, sizeof=lambda _, value: approximate_size(value))
+)
 
-    def __eq__(self, other):
-        return self.tx.id == other.tx.id
 
-    def __hash__(self):
-        return hash(self.tx.id)
+def _to_dict_memoizable(tx) -> bool:
+    return bool(tx and tx.id and to_dict.enabled and not getattr(tx, "_dirty", False))
 
 
-@lru_cache(maxsize=16384)
-def to_dict(func, tx_wrapped):
-    return func(tx_wrapped.tx)
+def memoized_frozen_dict(func: Callable, tx, frozen: bool = True) -> FrozenDict:
+    """Returns the read-only dict built by `func` for `tx`.
+
+    The result is memoized by the id of `tx` and shared between all callers.
+    Transactions that changed since their id was computed (`_dirty`) bypass
+    the cache. Their dict is only frozen if `frozen` is set, so callers that
+    merely read the dict can skip freezing it.
+    """
+    if not _to_dict_memoizable(tx):
+        return freeze(func(tx)) if frozen else func(tx)
+    key = (func, tx.id)
+    result = to_dict.get(key, _MISSING)
+    if result is _MISSING:
+        count("transaction.to_dict.cache_misses")
+        result = freeze(func(tx))
+        to_dict.put(key, result)
+    else:
+        count("transaction.to_dict.cache_hits")
+    return result
 
 
 def memoize_to_dict(func: Callable):
+    """Memoizes the dict representation of transactions by their id.
+
+    Note:
+        Every call returns a private, mutable copy of the memoized dict. Use
+        :func:`memoized_frozen_dict` to share the memoized dict without
+        copying.
+    """
+
     @functools.wraps(func)
     def memoized_func(*args, **kwargs):
-        if len(args) > 0 and args[0] and args[0].id:
-            return to_dict(func, ToDictWrapper(args[0]))
+        if len(args) == 1 and not kwargs and _to_dict_memoizable(args[0]):
+            return thaw(memoized_frozen_dict(func, args[0]))
         else:
             return func(*args, **kwargs)
 
     return memoized_func
+
+
+# NOTE: Maps (fulfillment URI, signing digest) to the result of validating
+#       the fulfillment. The fulfillment URI commits to the condition as well
+#       as to all signature bytes.
+verification_cache = register_cache("verification", LRUCache(maxsize=16384))
+
+# NOTE: Maps the structure of a condition, i.e. its public keys and thresholds
+#       (see `utils._fulfillment_to_key`), to its condition URI and read-only
+#       details.
+conditions = register_cache("conditions", LRUCache(maxsize=16384))
+
+# NOTE: Maps the hash of a script's code and canonical inputs to the output
+#       of executing it in the Zenroom VM, see `script.Script.validate`.
+script_results = register_cache("scripts", LRUCache(maxsize=4096))
@@ -0,0 +1,110 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# Planetmint and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""Streaming reading and writing of newline-delimited JSON (NDJSON)
+transaction dumps.
+
+Every line of a dump holds one transaction in its canonical JSON form, see
+:func:`~transactions.common.utils.serialize`. Records are read and written
+one at a time, so dumps of any size are processed in constant memory.
+"""
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional, TextIO, TypeVar, Union
+
+from transactions.common.exceptions import InvalidRecord, ValidationError
+from transactions.common.transaction import SCRIPT_EAGER, Transaction
+from transactions.common.utils import serialize
+
+T = TypeVar("T")
+
+
+def batched(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Yields lists of `size` items of `iterable`, the last one may be
+    shorter.
+
+    Raises:
+        ValueError: If `size` is not positive.
+    """
+    if size < 1:
+        raise ValueError("`size` must be positive")
+    iterator = iter(iterable)
+    batch = list(islice(iterator, size))
+    while batch:
+        yield batch
+        batch = list(islice(iterator, size))
+
+
+def write_transactions(transactions: Iterable[Union[Transaction, dict]], fp: TextIO, chunk_size: int = 1000) -> int:
+    """Writes transactions to an NDJSON dump.
+
+    Args:
+        transactions (iterable): The Transactions or transaction dicts to
+            write, e.g. a generator.
+        fp: A text file (or any object with a `write` method) to write to.
+        chunk_size (int): The number of records joined into a single
+            write.
+
+    Returns:
+        int: The number of records written.
+    """
+    written = 0
+    for chunk in batched(transactions, chunk_size):
+        fp.write("".join(serialize(tx.to_dict() if isinstance(tx, Transaction) else tx) + "\n" for tx in chunk))
+        written += len(chunk)
+    return written
+
+
+def read_transactions(
+    lines: Iterable[Union[str, bytes]],
+    validate: bool = False,
+    on_error: Optional[Callable[[InvalidRecord], None]] = None,
+    script_validation: str = SCRIPT_EAGER,
+) -> Iterator[Transaction]:
+    """Reads transactions from an NDJSON dump.
+
+    Empty lines are skipped.
+
+    Args:
+        lines (iterable): The lines of the dump, e.g. a text or binary file
+            or a generator.
+        validate (bool): Validate the schema and id of every record, see
+            :meth:`~.Transaction.from_json`. Without validation, only
+            records a Transaction can't be built from are invalid, e.g.
+            records missing a key.
+        on_error (callable, optional): Called with the
+            :exc:`~transactions.common.exceptions.InvalidRecord` of every
+            invalid record, which is then skipped. By default the error is
+            raised.
+        script_validation (str): When to validate scripts, see
+            :class:`~.Transaction`.
+
+    Yields:
+        :class:`~transactions.common.transaction.Transaction`
+
+    Raises:
+        :exc:`~transactions.common.exceptions.InvalidRecord`: If a record is
+            invalid and there is no `on_error` callback. The error has the
+            line number of the record and the original error as `error`.
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            tx = Transaction.from_json(line, validate=validate, script_validation=script_validation)
+        except ValidationError as exc:
+            error = InvalidRecord(line_number, exc)
+            if on_error is None:
+                raise error from exc
+            on_error(error)
+            continue
+        yield tx
+
+
+def read_batches(lines: Iterable[Union[str, bytes]], batch_size: int, **kwargs) -> Iterator[list[Transaction]]:
+    """Reads transactions from an NDJSON dump in lists of `batch_size`.
+
+    Takes the same keyword arguments as :func:`read_transactions`.
+    """
+    return batched(read_transactions(lines, **kwargs), batch_size)
@@ -9,9 +9,11 @@ from typing import Union, Optional
 import base58
 from planetmint_cryptoconditions import ThresholdSha256, Ed25519Sha256
 from planetmint_cryptoconditions import Fulfillment
+from planetmint_cryptoconditions.exceptions import UnsupportedTypeError
 
 from transactions.common.exceptions import AmountError
-from .utils import _fulfillment_to_details, _fulfillment_from_details
+from .memoize import conditions, freeze, thaw
+from .utils import _fulfillment_to_details, _fulfillment_from_details, _fulfillment_to_key
 
 
 class Output(object):
@@ -26,6 +28,8 @@ class Output(object):
                 owners before a Transaction was confirmed.
     """
 
+    __slots__ = ("_fulfillment", "_condition_key", "_condition_uri", "_details", "public_keys", "amount")
+
     MAX_AMOUNT = 9 * 10**18
 
     def __init__(self, fulfillment: type[Fulfillment], public_keys: Optional[list[str]] = None, amount: int = 1):
@@ -55,9 +59,70 @@ class Output(object):
         self.amount = amount
         self.public_keys = public_keys
 
+    @property
+    def fulfillment(self) -> Union[Fulfillment, str]:
+        return self._fulfillment
+
+    @fulfillment.setter
+    def fulfillment(self, fulfillment: Union[Fulfillment, str]):
+        self._fulfillment = fulfillment
+        self._condition_key = None
+        self._condition_uri = None
+        self._details = None
+
+    @property
+    def condition_uri(self) -> str:
+        """str: The URI of the Output's condition. It is computed once per
+        condition structure, see :meth:`_load_condition`.
+        """
+        if self._load_condition():
+            return self._condition_uri
+        try:
+            return self._fulfillment.condition_uri
+        except AttributeError:
+            # NOTE: Hashlock condition case
+            return self._fulfillment
+
+    def _load_condition(self) -> bool:
+        """Loads the condition URI and details of the Output from the shared
+        `conditions` cache. Outputs locked to the same public keys and
+        thresholds share the entry, so their condition is encoded only once.
+
+        The loaded condition is keyed by the structure of the fulfillment,
+        so changing the fulfillment in place, e.g. its threshold, loads the
+        new condition on the next access.
+
+        Returns:
+            bool: False if the condition can't be cached, e.g. for hashlock
+            conditions.
+        """
+        try:
+            key = _fulfillment_to_key(self._fulfillment)
+        except (AttributeError, UnsupportedTypeError):
+            return False
+        if key == self._condition_key:
+            return True
+        condition = conditions.get(key)
+        if condition is None:
+            condition = (self._fulfillment.condition_uri, freeze(_fulfillment_to_details(self._fulfillment)))
+            conditions.put(key, condition)
+        self._condition_key = key
+        self._condition_uri, self._details = condition
+        return True
+
     def __eq__(self, other):
-        # TODO: If `other !== Condition` return `False`
-        return self.to_dict() == other.to_dict()
+        if not isinstance(other, Output):
+            return NotImplemented
+        # NOTE: The condition URI commits to all public keys and thresholds
+        #       of the condition's details.
+        return (
+            self.amount == other.amount
+            and self.public_keys == other.public_keys
+            and self.condition_uri == other.condition_uri
+        )
+
+    def __hash__(self):
+        return hash((self.condition_uri, self.amount))
 
     def to_dict(self):
         """Transforms the object to a Python dictionary.
@@ -72,16 +137,16 @@ class Output(object):
         # TODO FOR CC: It must be able to recognize a hashlock condition
         #              and fulfillment!
         condition = {}
-        try:
-            # TODO verify if a script is returned in case of zenroom fulfillments
-            condition["details"] = _fulfillment_to_details(self.fulfillment)
-        except AttributeError:
-            pass
+        if self._load_condition():
+            condition["details"] = thaw(self._details)
+        else:
+            try:
+                # TODO verify if a script is returned in case of zenroom fulfillments
+                condition["details"] = _fulfillment_to_details(self.fulfillment)
+            except AttributeError:
+                pass
 
-        try:
-            condition["uri"] = self.fulfillment.condition_uri
-        except AttributeError:
-            condition["uri"] = self.fulfillment
+        condition["uri"] = self.condition_uri
 
         output = {
             "public_keys": self.public_keys,
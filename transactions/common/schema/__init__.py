@@ -12,6 +12,7 @@ import yaml
 import rapidjson
 
 from transactions.common.exceptions import SchemaValidationError
+from transactions.common.instrumentation import timed
 
 
 logger = logging.getLogger(__name__)
@@ -46,8 +47,91 @@ _, TX_SCHEMA_CHAIN_MIGRATION_ELECTION_2_0 = _load_schema("transaction_chain_migr
 _, TX_SCHEMA_VOTE_2_0 = _load_schema("transaction_vote", TX_SCHEMA_VERSION_2_0)
 
 
-def _validate_schema(schema, body):
-    """Validate data against a schema"""
+def _namespace_refs(node, prefix):
+    """Returns a copy of a schema node with all local `$ref`s pointing to
+    definitions prefixed with `prefix`.
+    """
+    if isinstance(node, list):
+        return [_namespace_refs(item, prefix) for item in node]
+    if not isinstance(node, dict):
+        return node
+    result = {}
+    for key, value in node.items():
+        if key == "$ref" and isinstance(value, str) and value.startswith("#/definitions/"):
+            result[key] = "#/definitions/" + prefix + value[len("#/definitions/") :]
+        else:
+            result[key] = _namespace_refs(value, prefix)
+    return result
+
+
+def _merge_schemas(*schemas):
+    """Merges schemas into a single, precompiled schema requiring all of them.
+
+    The definitions of every schema are namespaced, so equally named
+    definitions of different schemas don't clash.
+
+    Returns:
+        tuple: The merged schema and its :class:`rapidjson.Validator`.
+    """
+    merged = {"$schema": "http://json-schema.org/draft-04/schema#", "allOf": [], "definitions": {}}
+    for index, schema in enumerate(schemas):
+        prefix = "s{}_".format(index)
+        schema = _namespace_refs(schema, prefix)
+        schema.pop("$schema", None)
+        for name, definition in schema.pop("definitions", {}).items():
+            merged["definitions"][prefix + name] = definition
+        merged["allOf"].append(schema)
+    return merged, rapidjson.Validator(rapidjson.dumps(merged))
+
+
+TX_SCHEMAS_COMMON = {"3.0": TX_SCHEMA_COMMON, "2.0": TX_SCHEMA_COMMON_2_0}
+
+# NOTE: Maps (version, operation) to the merged schema of the common and the
+#       operation specific schemas. The entries with operation `None` hold
+#       the common schema only.
+_tx_schemas = {}
+
+
+def register_transaction_schema(operation: str, schemas: list, version: str = "3.0"):
+    """Registers the schemas a transaction of `operation` must satisfy on
+    top of the common transaction schema of `version`.
+
+    Args:
+        operation (str): The operation of the transaction, e.g. `TRANSFER`.
+        schemas (list): The operation specific schemas as loaded from YAML.
+        version (str): The transaction version the schemas apply to.
+    """
+    common = TX_SCHEMAS_COMMON[version][0]
+    operations = common["definitions"]["operation"]["enum"]
+    if operation not in operations:
+        common = dict(common, definitions=dict(common["definitions"]))
+        common["definitions"]["operation"] = dict(common["definitions"]["operation"], enum=operations + [operation])
+    _tx_schemas[(version, operation)] = _merge_schemas(common, *schemas)
+
+
+for _version, _common in TX_SCHEMAS_COMMON.items():
+    _tx_schemas[(_version, None)] = _merge_schemas(_common[0])
+
+register_transaction_schema("CREATE", [TX_SCHEMA_CREATE[0]])
+register_transaction_schema("TRANSFER", [TX_SCHEMA_TRANSFER[0]])
+register_transaction_schema("VALIDATOR_ELECTION", [TX_SCHEMA_VALIDATOR_ELECTION[0]])
+register_transaction_schema("CHAIN_MIGRATION_ELECTION", [TX_SCHEMA_CHAIN_MIGRATION_ELECTION[0]])
+register_transaction_schema("VOTE", [TX_SCHEMA_TRANSFER[0], TX_SCHEMA_VOTE[0]])
+register_transaction_schema("COMPOSE", [TX_SCHEMA_COMPOSE[0]])
+register_transaction_schema("DECOMPOSE", [TX_SCHEMA_DECOMPOSE[0]])
+
+register_transaction_schema("CREATE", [TX_SCHEMA_CREATE_2_0[0]], version="2.0")
+register_transaction_schema("TRANSFER", [TX_SCHEMA_TRANSFER_2_0[0]], version="2.0")
+register_transaction_schema("VALIDATOR_ELECTION", [TX_SCHEMA_VALIDATOR_ELECTION_2_0[0]], version="2.0")
+register_transaction_schema("CHAIN_MIGRATION_ELECTION", [TX_SCHEMA_CHAIN_MIGRATION_ELECTION_2_0[0]], version="2.0")
+register_transaction_schema("VOTE", [TX_SCHEMA_TRANSFER_2_0[0], TX_SCHEMA_VOTE_2_0[0]], version="2.0")
+
+
+def _validate_schema(schema, body, body_json=None):
+    """Validate data against a schema. If given, `body_json` is the JSON
+    document `body` was parsed from and gets validated instead of
+    serializing `body` again.
+    """
 
     # Note
     #
@@ -61,7 +145,7 @@ def _validate_schema(schema, body):
     # a helpful error message.
 
     try:
-        schema[1](rapidjson.dumps(body))
+        schema[1](rapidjson.dumps(body) if body_json is None else body_json)
     except ValueError as exc:
         try:
             jsonschema.validate(body, schema[0])
@@ -71,49 +155,28 @@ def _validate_schema(schema, body):
         raise SchemaValidationError(str(exc)) from exc
 
 
-def validate_transaction_schema(tx: dict):
+@timed("transaction.validate_schema")
+def validate_transaction_schema(tx: dict, tx_json=None):
     """Validate a transaction dict.
 
     TX_SCHEMA_COMMON contains properties that are common to all types of
     transaction. TX_SCHEMA_[TRANSFER|CREATE] add additional constraints on top.
+    Both are merged into a single schema per version and operation, so the
+    transaction is serialized and validated only once.
+
+    Args:
+        tx (dict): The transaction to validate.
+        tx_json (str|bytes, optional): The JSON document `tx` was parsed
+            from. It is validated as is, without serializing `tx` again.
     """
     try:
-        if tx["version"] == "3.0":
-            # generic validation
-            _validate_schema(TX_SCHEMA_COMMON, tx)
-
-            # special validation
-            if tx["operation"] == "CREATE":
-                _validate_schema(TX_SCHEMA_CREATE, tx)
-            elif tx["operation"] == "TRANSFER":
-                _validate_schema(TX_SCHEMA_TRANSFER, tx)
-            elif tx["operation"] == "VALIDATOR_ELECTION":
-                _validate_schema(TX_SCHEMA_VALIDATOR_ELECTION, tx)
-            elif tx["operation"] == "CHAIN_MIGRATION_ELECTION":
-                _validate_schema(TX_SCHEMA_CHAIN_MIGRATION_ELECTION, tx)
-            elif tx["operation"] == "VOTE":
-                _validate_schema(TX_SCHEMA_TRANSFER, tx)
-                _validate_schema(TX_SCHEMA_VOTE, tx)
-            elif tx["operation"] == "COMPOSE":
-                _validate_schema(TX_SCHEMA_COMPOSE, tx)
-            elif tx["operation"] == "DECOMPOSE":
-                _validate_schema(TX_SCHEMA_DECOMPOSE, tx)
-
-        else:
-            # generic validation
-            _validate_schema(TX_SCHEMA_COMMON_2_0, tx)
-
-            # special validation
-            if tx["operation"] == "CREATE":
-                _validate_schema(TX_SCHEMA_CREATE_2_0, tx)
-            elif tx["operation"] == "TRANSFER":
-                _validate_schema(TX_SCHEMA_TRANSFER_2_0, tx)
-            elif tx["operation"] == "VALIDATOR_ELECTION":
-                _validate_schema(TX_SCHEMA_VALIDATOR_ELECTION_2_0, tx)
-            elif tx["operation"] == "CHAIN_MIGRATION_ELECTION":
-                _validate_schema(TX_SCHEMA_CHAIN_MIGRATION_ELECTION_2_0, tx)
-            elif tx["operation"] == "VOTE":
-                _validate_schema(TX_SCHEMA_TRANSFER_2_0, tx)
-                _validate_schema(TX_SCHEMA_VOTE_2_0, tx)
+        version = "3.0" if tx["version"] == "3.0" else "2.0"
     except KeyError:
         raise SchemaValidationError()
+    operation = tx.get("operation")
+    # NOTE: Operations of other types can't be looked up, the common schema
+    #       rejects them
+    if not isinstance(operation, str):
+        operation = None
+    schema = _tx_schemas.get((version, operation)) or _tx_schemas[(version, None)]
+    _validate_schema(schema, tx, tx_json)
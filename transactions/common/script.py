@@ -4,9 +4,138 @@
 # Code is Apache-2.0 and docs are CC-BY-4.0
 
 import json
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from hashlib import sha3_256
+from typing import Any, Iterable, Optional
 from zenroom import zencode_exec
 from json.decoder import JSONDecodeError
 
+from transactions.common.exceptions import ScriptTimeout
+from transactions.common.instrumentation import timed
+from transactions.common.memoize import script_results
+from transactions.common.utils import serialize
+
+# NOTE: The result of scripts that failed to execute
+_INVALID = object()
+_MISSING = object()
+
+
+def _execute(code: str, inputs: Any) -> Any:
+    """Executes `code` on `inputs` in the Zenroom VM.
+
+    Returns:
+        The parsed output of the script, or `_INVALID` if it failed.
+    """
+    result = zencode_exec(code, data=json.dumps(inputs))
+
+    if len(result.output) == 0 and len(result.logs) > 0:
+        return _INVALID
+
+    try:
+        return json.loads(result.output)
+    except JSONDecodeError:
+        return _INVALID
+
+
+class Contract(object):
+    """The code of a Zencode contract and its id, the hex encoded hash of
+    the code.
+    """
+
+    __slots__ = ("id", "code", "__weakref__")
+
+    def __init__(self, code: str):
+        self.code = code
+        self.id = sha3_256(code.encode()).hexdigest()
+
+    def __repr__(self):
+        return "<Contract {}>".format(self.id)
+
+    # NOTE: Contracts are immutable, copies would only defeat the interning
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return _intern_contract, (self.code,)
+
+
+class ContractRegistry(object):
+    """Interns contracts by their code.
+
+    Scripts running the same code share one :class:`Contract`, so the code
+    is kept and hashed only once however many Transactions use it. Contracts
+    are dropped once no Script uses them, unless they were registered.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_code = weakref.WeakValueDictionary()
+        self._by_id = weakref.WeakValueDictionary()
+        self._registered = {}
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __contains__(self, contract_id: str) -> bool:
+        return contract_id in self._by_id
+
+    def intern(self, code: str) -> Contract:
+        """Returns the :class:`Contract` of `code`.
+
+        Raises:
+            TypeError: If `code` is not a string.
+        """
+        contract = self._by_code.get(code)
+        if contract is not None:
+            return contract
+        if not isinstance(code, str):
+            raise TypeError("`code` must be a string")
+        with self._lock:
+            contract = self._by_code.get(code)
+            if contract is None:
+                contract = Contract(code)
+                self._by_code[code] = contract
+                self._by_id[contract.id] = contract
+        return contract
+
+    def register(self, code: str) -> str:
+        """Keeps the contract of `code` until it's unregistered.
+
+        Returns:
+            str: The id of the contract.
+        """
+        contract = self.intern(code)
+        with self._lock:
+            self._registered[contract.id] = contract
+        return contract.id
+
+    def unregister(self, contract_id: str) -> None:
+        with self._lock:
+            self._registered.pop(contract_id, None)
+
+    def get(self, contract_id: str) -> Contract:
+        """Returns the contract with the id `contract_id`.
+
+        Raises:
+            KeyError: If no Script uses the contract and it isn't registered.
+        """
+        contract = self._by_id.get(contract_id)
+        if contract is None:
+            raise KeyError("unknown contract {}".format(contract_id))
+        return contract
+
+
+contracts = ContractRegistry()
+
+
+def _intern_contract(code: str) -> Contract:
+    return contracts.intern(code)
+
 
 class Script(object):
     def __init__(self, code, inputs, outputs):
@@ -14,6 +143,33 @@ class Script(object):
         self.inputs = inputs
         self.outputs = outputs
 
+    @property
+    def code(self) -> str:
+        return self._contract.code
+
+    @code.setter
+    def code(self, code: str) -> None:
+        self._contract = contracts.intern(code)
+
+    @property
+    def contract(self) -> Contract:
+        return self._contract
+
+    @classmethod
+    def from_contract(cls, contract_id: str, inputs, outputs):
+        """Creates a Script running a contract of the registry.
+
+        Args:
+            contract_id (str): The id of the contract, see
+                :meth:`ContractRegistry.register`.
+            inputs: The inputs of the script.
+            outputs: The expected outputs of the script.
+
+        Raises:
+            KeyError: If the contract is unknown.
+        """
+        return cls(contracts.get(contract_id).code, inputs, outputs)
+
     @classmethod
     def from_dict(cls, data: dict):
         return Script(data["code"], data["inputs"], data["outputs"])
@@ -25,22 +181,125 @@ class Script(object):
             "outputs": self.outputs,
         }
 
-    def validate(self) -> bool:
-        result = zencode_exec(self.code, data=json.dumps(self.inputs))
+    @property
+    def key(self) -> bytes:
+        """The hash of the contract id and the canonical inputs of the
+        script.
+
+        Scripts with the same key produce the same output.
+        """
+        return sha3_256(serialize([self._contract.id, self.inputs]).encode()).digest()
 
-        if len(result.output) == 0 and len(result.logs) > 0:
+    def _result(self) -> Any:
+        # NOTE: Executing a script is deterministic, so its output is
+        #       memoized by the script's code and inputs
+        key = self.key
+        result = script_results.get(key, _MISSING)
+        if result is _MISSING:
+            result = _execute(self.code, self.inputs)
+            script_results.put(key, result)
+        return result
+
+    @timed("script.validate")
+    def validate(self) -> bool:
+        result = self._result()
+        if result is _INVALID:
             return False
 
+        # output tag is only defined if zenroom returns a type (int, string, ...)
+        # in case a 'variable' is returned, the output will look like follows: 'variable':'value'
+        # that's the cause for the KeyError catch
         try:
-            result = json.loads(result.output)
-            # output tag is only defined if zenroom returns a type (int, string, ...)
-            # in case a 'variable' is returned, the output will look like follows: 'variable':'value'
-            # that's the cause for the KeyError catch
-            try:
-                result["output"]
-            except KeyError:
-                return result == self.outputs
-            else:
-                return result["output"] == self.outputs
-        except JSONDecodeError:
-            return False
+            result["output"]
+        except KeyError:
+            return result == self.outputs
+        else:
+            return result["output"] == self.outputs
+
+
+class ScriptPool(object):
+    """Validates Scripts concurrently with a timeout.
+
+    Every worker drives one Zenroom VM process at a time. The results are
+    memoized like the ones of :meth:`Script.validate`, so validating the
+    scripts of many Transactions with a pool before loading them means the
+    Transactions won't execute their scripts again.
+
+    Note:
+        A script that timed out can't be interrupted, it keeps a worker
+        busy until it finished.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, timeout: Optional[float] = None):
+        """Create a :class:`~.ScriptPool`.
+
+        Args:
+            max_workers (int, optional): The maximum number of scripts
+                executed at the same time.
+            timeout (float, optional): The number of seconds to wait for a
+                script by default.
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="zenroom")
+        self.timeout = timeout
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self, block: bool = True) -> None:
+        """Shuts the pool down, cancelling all scripts that didn't start.
+
+        Args:
+            block (bool): Wait for the running scripts to finish.
+        """
+        self._executor.shutdown(wait=block, cancel_futures=True)
+
+    def submit(self, script: Script) -> Future:
+        """Schedules the validation of `script`.
+
+        Returns:
+            :class:`concurrent.futures.Future`: The result of
+            :meth:`Script.validate`.
+        """
+        return self._executor.submit(script.validate)
+
+    def validate(self, script: Script, timeout: Optional[float] = _MISSING) -> bool:
+        """Validates `script` on the pool.
+
+        Args:
+            script (:class:`Script`): The script to validate.
+            timeout (float, optional): The number of seconds to wait,
+                defaults to the timeout of the pool.
+
+        Raises:
+            :exc:`~transactions.common.exceptions.ScriptTimeout`: If the
+                script didn't finish in time.
+        """
+        return self.validate_many([script], timeout)[0]
+
+    def validate_many(self, scripts: Iterable[Script], timeout: Optional[float] = _MISSING) -> list[bool]:
+        """Validates `scripts` concurrently.
+
+        Args:
+            scripts (iterable): The scripts to validate.
+            timeout (float, optional): The number of seconds to wait for all
+                scripts, defaults to the timeout of the pool.
+
+        Returns:
+            :obj:`list` of :obj:`bool`: If each script is valid.
+
+        Raises:
+            :exc:`~transactions.common.exceptions.ScriptTimeout`: If any
+                script didn't finish in time.
+        """
+        if timeout is _MISSING:
+            timeout = self.timeout
+        futures = [self.submit(script) for script in scripts]
+        _, not_done = wait(futures, timeout)
+        if not_done:
+            for future in not_done:
+                future.cancel()
+            raise ScriptTimeout("{} script(s) didn't finish in {} seconds".format(len(not_done), timeout))
+        return [future.result() for future in futures]
@@ -9,13 +9,17 @@ payloads.
 Attributes:
     UnspentOutput (namedtuple): Object holding the information
         representing an unspent output.
+    UnspentOutputs (namedtuple): Object holding the unspent outputs of
+        many transactions column by column.
 
 """
+import asyncio
+import inspect
+from array import array
 from collections import namedtuple
-from copy import deepcopy
-from functools import lru_cache
-from typing import Optional
-import rapidjson
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import Optional, Union
 
 import base58
 from planetmint_cryptoconditions import Fulfillment, ThresholdSha256, Ed25519Sha256
@@ -24,15 +28,30 @@ from cid import is_cid
 
 from hashlib import sha3_256
 
-from transactions.common.crypto import PrivateKey, hash_data
+from transactions.common.crypto import Keyring, hash_data
+from transactions.common.instrumentation import count, span, timed
 from transactions.common.exceptions import (
     KeypairMismatchException,
     InvalidHash,
+    InvalidScript,
     AssetIdMismatch,
 )
-from transactions.common.schema import validate_transaction_schema
-from transactions.common.utils import serialize
-from .memoize import memoize_from_dict, memoize_to_dict
+from transactions.common.schema import register_transaction_schema, validate_transaction_schema
+from transactions.common.utils import (
+    _copy_fulfillment,
+    deserialize,
+    serialize,
+    serialize_transaction,
+    serialize_transaction_fragments,
+    splice_fulfillments,
+)
+from .memoize import (
+    _to_dict_memoizable,
+    memoize_from_dict,
+    memoize_to_dict,
+    memoized_frozen_dict,
+    verification_cache,
+)
 from .input import Input
 from .output import Output
 from .transaction_link import TransactionLink
@@ -51,6 +70,17 @@ UnspentOutput = namedtuple(
     ),
 )
 
+UnspentOutputs = namedtuple(
+    "UnspentOutputs",
+    (
+        "transaction_ids",
+        "output_indices",
+        "amounts",
+        "asset_ids",
+        "condition_uris",
+    ),
+)
+
 CREATE = "CREATE"
 TRANSFER = "TRANSFER"
 VALIDATOR_ELECTION = "VALIDATOR_ELECTION"
@@ -61,6 +91,11 @@ DECOMPOSE = "DECOMPOSE"
 ASSETS = "assets"
 METADATA = "metadata"
 DATA = "data"
+# NOTE: When the script of a Transaction is validated, see `Transaction`
+SCRIPT_EAGER = "eager"
+SCRIPT_DEFERRED = "deferred"
+SCRIPT_TRUSTED = "trusted"
+SCRIPT_VALIDATION_POLICIES = (SCRIPT_EAGER, SCRIPT_DEFERRED, SCRIPT_TRUSTED)
 
 
 class Transaction(object):
@@ -110,6 +145,7 @@ class Transaction(object):
         hash_id=None,
         tx_dict=None,
         script: Optional[Script] = None,
+        script_validation: str = SCRIPT_EAGER,
     ):
         """The constructor allows to create a customizable Transaction.
 
@@ -117,6 +153,13 @@ class Transaction(object):
             When no `version` is provided, one is being
             generated by this method.
 
+            The `script_validation` policy decides when the script is
+            executed: `SCRIPT_EAGER` validates it right away,
+            `SCRIPT_DEFERRED` on the first call of :meth:`inputs_valid` or
+            :meth:`validate_script`, and `SCRIPT_TRUSTED` only if
+            :meth:`validate_script` is called, e.g. for Transactions that
+            have been committed already.
+
         Args:
             operation (str): Defines the operation of the Transaction.
             assets (:obj:`list` of :obj:`dict`): Asset payload for this Transaction.
@@ -129,6 +172,10 @@ class Transaction(object):
                 Transaction.
             version (string): Defines the version number of a Transaction.
             hash_id (string): Hash id of the transaction.
+            script (:class:`~transactions.common.script.Script`, optional):
+                Script whose inputs must produce its outputs.
+            script_validation (str): When to validate the script, one of
+                `SCRIPT_EAGER`, `SCRIPT_DEFERRED` and `SCRIPT_TRUSTED`.
         """
         if operation not in self.ALLOWED_OPERATIONS:
             allowed_ops = ", ".join(self.__class__.ALLOWED_OPERATIONS)
@@ -191,8 +238,11 @@ class Transaction(object):
         if script is not None and not isinstance(script, Script):
             raise TypeError("`script` must be a dict or None")
 
-        if script is not None and not script.validate():
-            raise ValueError("`script` input to output validation failed")
+        if script_validation not in SCRIPT_VALIDATION_POLICIES:
+            raise ValueError("`script_validation` must be one of {}".format(", ".join(SCRIPT_VALIDATION_POLICIES)))
+
+        if script is not None and script_validation == SCRIPT_EAGER and not script.validate():
+            raise InvalidScript("`script` input to output validation failed")
 
         self.version = version if version is not None else Transaction.__VERSION__
         self.operation = operation
@@ -201,8 +251,38 @@ class Transaction(object):
         self.outputs = outputs or []
         self.metadata = metadata
         self.script = script
+        self._script_validated = script is None or script_validation != SCRIPT_DEFERRED
         self._id = hash_id
         self.tx_dict = tx_dict
+        self._signing_hasher = None
+        self._dirty = False
+
+    @property
+    def inputs(self) -> list[Input]:
+        if self._inputs is None:
+            self._inputs = [Input.from_dict(input_) for input_ in self.tx_dict["inputs"]]
+        return self._inputs
+
+    @inputs.setter
+    def inputs(self, inputs: list[Input]):
+        self._inputs = inputs
+
+    @property
+    def outputs(self) -> list[Output]:
+        if self._outputs is None:
+            self._outputs = [Output.from_dict(output) for output in self.tx_dict["outputs"]]
+        return self._outputs
+
+    @outputs.setter
+    def outputs(self, outputs: list[Output]):
+        self._outputs = outputs
+
+    @property
+    def is_materialized(self) -> bool:
+        """bool: Whether the Inputs and Outputs of a lazily loaded
+        Transaction have been built.
+        """
+        return self._inputs is not None and self._outputs is not None
 
     @staticmethod
     def get_assets_tag(version):
@@ -265,38 +345,122 @@ class Transaction(object):
         """
         if self.operation in (self.CREATE, self.TRANSFER, self.COMPOSE, self.DECOMPOSE):
             self._asset_id = Transaction.read_out_asset_id(self)
+        if self._outputs is None:
+            # NOTE: Lazily loaded Transactions read the condition URIs as
+            #       stored, without rebuilding the conditions from their details
+            return (
+                UnspentOutput(
+                    transaction_id=self._id,
+                    output_index=output_index,
+                    amount=int(output["amount"]),
+                    asset_id=self._asset_id,
+                    condition_uri=output["condition"]["uri"],
+                )
+                for output_index, output in enumerate(self.tx_dict["outputs"])
+            )
         return (
             UnspentOutput(
                 transaction_id=self._id,
                 output_index=output_index,
                 amount=output.amount,
                 asset_id=self._asset_id,
-                condition_uri=output.fulfillment.condition_uri,
+                condition_uri=output.condition_uri,
             )
             for output_index, output in enumerate(self.outputs)
         )
 
+    @staticmethod
+    def batch_unspent_outputs(transactions: list) -> UnspentOutputs:
+        """Collects the :attr:`unspent_outputs` of many Transactions into
+        columns, e.g. to bulk load them into a UTXO table.
+
+        Note:
+            Condition URIs come from the shared condition cache, see
+            :attr:`~transactions.common.output.Output.condition_uri`. Lazily
+            loaded Transactions provide the condition URIs as stored.
+
+        Args:
+            transactions (:obj:`list` of :class:`~transactions.common.
+                transaction.Transaction`): The Transactions to collect the
+                outputs of.
+
+        Returns:
+            :class:`~.UnspentOutputs`: The transaction ids as :obj:`bytes`,
+            the output indices as an unsigned and the amounts as a signed
+            64 bit :class:`array.array`, as well as lists of the asset ids and
+            condition URIs.
+        """
+        columns = UnspentOutputs([], array("Q"), array("q"), [], [])
+        for tx in transactions:
+            transaction_id = bytes.fromhex(tx.id)
+            asset_id = None
+            if tx.operation in (tx.CREATE, tx.TRANSFER, tx.COMPOSE, tx.DECOMPOSE):
+                asset_id = Transaction.read_out_asset_id(tx)
+
+            if tx._outputs is None:
+                outputs = ((int(output["amount"]), output["condition"]["uri"]) for output in tx.tx_dict["outputs"])
+            else:
+                outputs = ((output.amount, output.condition_uri) for output in tx.outputs)
+
+            for output_index, (amount, condition_uri) in enumerate(outputs):
+                columns.transaction_ids.append(transaction_id)
+                columns.output_indices.append(output_index)
+                columns.amounts.append(amount)
+                columns.asset_ids.append(asset_id)
+                columns.condition_uris.append(condition_uri)
+        return columns
+
     @property
     def spent_outputs(self):
         """Tuple of :obj:`dict`: Inputs of this transaction. Each input
         is represented as a dictionary containing a transaction id and
         output index.
         """
-        return (input_.fulfills.to_dict() for input_ in self.inputs if input_.fulfills)
+        if self._inputs is None:
+            links = (TransactionLink.from_dict(input_["fulfills"]) for input_ in self.tx_dict["inputs"])
+        else:
+            links = (input_.fulfills for input_ in self.inputs)
+        return (link.to_dict() for link in links if link)
 
     @property
     def serialized(self):
-        return Transaction._to_str(self.to_dict())
+        return Transaction._to_str(self._as_dict())
+
+    def _hash(self, fragments: Optional[list[str]] = None):
+        """Computes the id of the Transaction.
+
+        Args:
+            fragments (:obj:`list` of :obj:`str`, optional): The serialized
+                unsigned body as returned by :meth:`_reset_signing_digest`.
+                If given, only the fulfillments are serialized again.
+        """
+        if fragments is None:
+            self._id = hash_data(self.serialized)
+        else:
+            fulfillments = [input_._serialize_fulfillment() for input_ in self.inputs]
+            self._id = hash_data(splice_fulfillments(fragments, fulfillments))
+        self._dirty = False
 
-    def _hash(self):
-        self._id = hash_data(self.serialized)
+    def _invalidate(self):
+        """Marks the Transaction as changed since its id was computed.
+
+        Note:
+            Until the Transaction is hashed again, its memoized dict and the
+            dict it was loaded from are no longer used.
+        """
+        # NOTE: Lazily loaded Inputs and Outputs must be built before the dict
+        #       backing them is dropped
+        self._inputs, self._outputs = self.inputs, self.outputs
+        self._dirty = True
+        self.tx_dict = None
+        self._signing_hasher = None
 
     def __eq__(self, other):
         try:
-            other = other.to_dict()
+            other = other._as_dict() if isinstance(other, Transaction) else other.to_dict()
         except AttributeError:
             return False
-        return self.to_dict() == other
+        return self._as_dict() == other
 
     def to_inputs(self, indices: Optional[list[int]] = None) -> list[Input]:
         """Converts a Transaction's outputs to spendable inputs.
@@ -340,6 +504,7 @@ class Transaction(object):
         if not isinstance(input_, Input):
             raise TypeError("`input_` must be a Input instance")
         self.inputs.append(input_)
+        self._invalidate()
 
     def add_output(self, output: Output) -> None:
         """Adds an output to a Transaction's list of outputs.
@@ -352,8 +517,9 @@ class Transaction(object):
         if not isinstance(output, Output):
             raise TypeError("`output` must be an Output instance or None")
         self.outputs.append(output)
+        self._invalidate()
 
-    def sign(self, private_keys: list[str]):
+    def sign(self, private_keys: list[str], max_workers: Optional[int] = None):
         """Fulfills a previous Transaction's Output by signing Inputs.
 
         Note:
@@ -366,42 +532,43 @@ class Transaction(object):
             will cause this method to fail.
 
         Args:
-            private_keys (:obj:`list` of :obj:`str`): A complete list of
-                all private keys needed to sign all Fulfillments of this
-                Transaction.
+            private_keys (:obj:`list` of :obj:`str`|:class:`~transactions.
+                common.crypto.Keyring`): A complete list of all private keys
+                needed to sign all Fulfillments of this Transaction. Pass a
+                Keyring to reuse decoded keys across Transactions.
+            max_workers (int, optional): If set, the Inputs are signed
+                concurrently by a pool of up to `max_workers` threads. The
+                Ed25519 backend releases the GIL while signing, so this pays
+                off for Transactions with many Inputs. The result is the
+                same as signing sequentially.
 
         Returns:
             :class:`~transactions.common.transaction.Transaction`
         """
         # TODO: Singing should be possible with at least one of all private
         #       keys supplied to this method.
+        if isinstance(private_keys, Keyring):
+            return self._sign_with_key_pairs(private_keys, max_workers)
         if private_keys is None or not isinstance(private_keys, list):
             raise TypeError("`private_keys` must be a list instance")
 
-        # NOTE: Generate public keys from private keys and match them in a
-        #       dictionary:
-        #                   key:     public_key
-        #                   value:   private_key
-        def gen_public_key(private_key):
-            # TODO FOR CC: Adjust interface so that this function becomes
-            #              unnecessary
-
-            # cc now provides a single method `encode` to return the key
-            # in several different encodings.
-            public_key = private_key.get_verifying_key().encode()
-            # Returned values from cc are always bytestrings so here we need
-            # to decode to convert the bytestring into a python str
-            return public_key.decode()
-
-        key_pairs = {gen_public_key(PrivateKey(private_key)): PrivateKey(private_key) for private_key in private_keys}
-
-        tx_dict = self.to_dict()
-        tx_dict = Transaction._remove_signatures(tx_dict)
-        tx_serialized = Transaction._to_str(tx_dict)
-        for i, input_ in enumerate(self.inputs):
-            self.inputs[i] = self._sign_input(input_, tx_serialized, key_pairs)
+        return self._sign_with_key_pairs(Keyring(private_keys), max_workers)
+
+    @timed("transaction.sign")
+    def _sign_with_key_pairs(self, key_pairs: Keyring, max_workers: Optional[int] = None):
+        self._invalidate()
+        fragments = self._reset_signing_digest(self)
+        # NOTE: Every Input is signed on a copy of its own, so the Inputs can
+        #       be signed in any order and by any thread
+        messages = [self.signing_digest(i) for i in range(len(self.inputs))]
+        if max_workers and max_workers > 1 and len(self.inputs) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(self.inputs))) as executor:
+                signed = list(executor.map(self._sign_input, self.inputs, messages, repeat(key_pairs)))
+        else:
+            signed = [self._sign_input(input_, message, key_pairs) for input_, message in zip(self.inputs, messages)]
+        self.inputs[:] = signed
 
-        self._hash()
+        self._hash(fragments)
 
         return self
 
@@ -415,24 +582,132 @@ class Transaction(object):
         Args:
             callback (function): A callback used to sign inputs. Callback
                 takes input dict and message to sign as arguments
-                and returns signature (bytes).
+                and returns signature (bytes). A :class:`~transactions.
+                common.crypto.Keyring` can be passed as callback.
         Returns:
             :class:`~planetmint.common.transaction.Transaction`
         """
-        tx_dict = self.to_dict()
-        tx_dict = Transaction._remove_signatures(tx_dict)
-        tx_serialized = Transaction._to_str(tx_dict)
-        message = sha3_256(tx_serialized.encode())
-        for input_ in self.inputs:
-            if input_.fulfills:
-                message.update("{}{}".format(input_.fulfills.txid, input_.fulfills.output).encode())
-            signature = callback(input_.to_dict(), message.digest())
+        self._invalidate()
+        fragments = self._reset_signing_digest(self)
+        for i, input_ in enumerate(self.inputs):
+            signature = callback(input_.to_dict(), self.signing_digest(i))
             input_.fulfillment.signature = signature
-        self._hash()
+        self._hash(fragments)
         return self
 
+    async def delegate_signing_async(
+        self, callback, max_concurrency: Optional[int] = None, timeout: Optional[float] = None
+    ):
+        """Fulfills a previous Transaction's Output by signing Inputs using
+        an asynchronous callback, e.g. a remote signing service.
+
+        The signing requests of all Inputs are sent concurrently. The Inputs
+        are only signed once all requests succeeded, so the Transaction is
+        left unsigned if any of them fails or times out. The messages to
+        sign are the same as in :meth:`delegate_signing`.
+
+        Args:
+            callback (function): A coroutine function used to sign inputs.
+                It takes the input dict and the message to sign as arguments
+                and returns the signature (bytes). Plain functions, like a
+                :class:`~transactions.common.crypto.Keyring`, are accepted
+                as well.
+            max_concurrency (int, optional): The maximum number of signing
+                requests in flight at the same time. Unlimited by default.
+            timeout (float, optional): The number of seconds each signing
+                request may take.
+
+        Returns:
+            :class:`~planetmint.common.transaction.Transaction`
+
+        Raises:
+            :exc:`asyncio.TimeoutError`: If a signing request timed out.
+        """
+        self._invalidate()
+        fragments = self._reset_signing_digest(self)
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def request(input_dict, message):
+            signature = callback(input_dict, message)
+            if inspect.isawaitable(signature):
+                signature = await asyncio.wait_for(signature, timeout)
+            return signature
+
+        async def sign(input_dict, message):
+            if semaphore is None:
+                return await request(input_dict, message)
+            async with semaphore:
+                return await request(input_dict, message)
+
+        requests = [
+            asyncio.ensure_future(sign(input_.to_dict(), self.signing_digest(i)))
+            for i, input_ in enumerate(self.inputs)
+        ]
+        try:
+            signatures = await asyncio.gather(*requests)
+        except BaseException:
+            for future in requests:
+                future.cancel()
+            raise
+
+        for input_, signature in zip(self.inputs, signatures):
+            input_.fulfillment.signature = signature
+        self._hash(fragments)
+        return self
+
+    def _reset_signing_digest(self, tx: Optional[Union[dict, "Transaction"]] = None) -> list[str]:
+        """Hashes the unsigned Transaction body that all signing digests are
+        forked from.
+
+        Args:
+            tx (dict|:class:`~transactions.common.transaction.Transaction`,
+                optional): The representation of this Transaction to hash.
+                Defaults to the dictionary it was loaded from, if any.
+
+        Returns:
+            :obj:`list` of :obj:`str`: The serialized body, split at the
+            fulfillments (see :func:`~transactions.common.utils.
+            serialize_transaction_fragments`). Pass it to :meth:`_hash`
+            once the Inputs are signed.
+        """
+        if tx is None:
+            tx = self.tx_dict if self.tx_dict else self
+        if isinstance(tx, Transaction):
+            # NOTE: The fulfillments are stripped anyway, so they are only
+            #       serialized if the Transaction's dict is memoized already
+            tx = (
+                tx._as_dict()
+                if _to_dict_memoizable(tx)
+                else tx._to_dict([input_._to_dict(None) for input_ in tx.inputs])
+            )
+        fragments = serialize_transaction_fragments(tx)
+        self._signing_hasher = sha3_256("null".join(fragments).encode())
+        return fragments
+
+    def signing_digest(self, input_index: int) -> bytes:
+        """Returns the message the fulfillment of an Input signs.
+
+        Note:
+            The digest covers the Transaction body without signatures and
+            id, followed by the output the Input spends. The hash of the body
+            is computed once and then forked for every Input.
+
+        Args:
+            input_index (int): The index of the Input.
+
+        Returns:
+            bytes: The SHA3-256 digest to sign or verify.
+        """
+        if self._signing_hasher is None:
+            self._reset_signing_digest()
+        sha3_message = self._signing_hasher.copy()
+        fulfills = self.inputs[input_index].fulfills
+        if fulfills:
+            sha3_message.update("{}{}".format(fulfills.txid, fulfills.output).encode())
+        return sha3_message.digest()
+
     @classmethod
-    def _sign_input(cls, input_: Input, message: str, key_pairs: dict) -> Input:
+    def _sign_input(cls, input_: Input, message: bytes, key_pairs: Keyring) -> Input:
         """Signs a single Input.
 
         Note:
@@ -443,8 +718,9 @@ class Transaction(object):
         Args:
             input_ (:class:`~transactions.common.transaction.
                 Input`) The Input to be signed.
-            message (str): The message to be signed
-            key_pairs (dict): The keys to sign the Transaction with.
+            message (bytes): The signing digest of the Input.
+            key_pairs (:class:`~transactions.common.crypto.Keyring`): The keys
+                to sign the Transaction with.
         """
         if isinstance(input_.fulfillment, Ed25519Sha256):
             return cls._sign_ed25519_signature_fulfillment(input_, message, key_pairs)
@@ -454,49 +730,58 @@ class Transaction(object):
             raise ValueError("Fulfillment couldn't be matched to crypto condition fulfillment type.")
 
     @classmethod
-    def _sign_ed25519_signature_fulfillment(cls, input_: Input, message: str, key_pairs: dict) -> Input:
+    def _sign_ed25519_signature_fulfillment(cls, input_: Input, message: bytes, key_pairs: Keyring) -> Input:
         """Signs a Ed25519Fulfillment.
 
         Args:
             input_ (:class:`~transactions.common.transaction.
                 Input`) The input to be signed.
-            message (str): The message to be signed
-            key_pairs (dict): The keys to sign the Transaction with.
+            message (bytes): The signing digest of the Input.
+            key_pairs (:class:`~transactions.common.crypto.Keyring`): The keys
+                to sign the Transaction with.
         """
         # NOTE: To eliminate the dangers of accidentally signing a condition by
         #       reference, we remove the reference of input_ here
         #       intentionally. If the user of this class knows how to use it,
         #       this should never happen, but then again, never say never.
-        input_ = deepcopy(input_)
+        input_ = cls._copy_input(input_)
         public_key = input_.owners_before[0]
-        sha3_message = sha3_256(message.encode())
-        if input_.fulfills:
-            sha3_message.update("{}{}".format(input_.fulfills.txid, input_.fulfills.output).encode())
 
-        try:
-            # cryptoconditions makes no assumptions of the encoding of the
-            # message to sign or verify. It only accepts bytestrings
-            input_.fulfillment.sign(sha3_message.digest(), base58.b58decode(key_pairs[public_key].encode()))
-        except KeyError:
+        if public_key not in key_pairs:
             raise KeypairMismatchException(
                 "Public key {} is not a pair to " "any of the private keys".format(public_key)
             )
+
+        # cryptoconditions makes no assumptions of the encoding of the
+        # message to sign or verify. It only accepts bytestrings
+        Transaction._sign_fulfillment(input_.fulfillment, key_pairs, public_key, message)
         return input_
 
+    @staticmethod
+    def _copy_input(input_: Input) -> Input:
+        # NOTE: Builds a new fulfillment instead of deep copying the Input, the
+        #       TransactionLink is never modified and can be shared
+        return Input(_copy_fulfillment(input_.fulfillment), list(input_.owners_before), input_.fulfills)
+
+    @staticmethod
+    def _sign_fulfillment(fulfillment: Ed25519Sha256, key_pairs: Keyring, public_key: str, message: bytes):
+        # NOTE: Same as `fulfillment.sign(message, <raw private key>)`, without
+        #       decoding the private key and deriving its public key again
+        fulfillment.public_key = key_pairs.raw_public_key(public_key)
+        fulfillment.signature = key_pairs.sign(public_key, message)
+
     @classmethod
-    def _sign_threshold_signature_fulfillment(cls, input_: Input, message: str, key_pairs: dict) -> Input:
+    def _sign_threshold_signature_fulfillment(cls, input_: Input, message: bytes, key_pairs: Keyring) -> Input:
         """Signs a ThresholdSha256.
 
         Args:
             input_ (:class:`~transactions.common.transaction.
                 Input`) The Input to be signed.
-            message (str): The message to be signed
-            key_pairs (dict): The keys to sign the Transaction with.
+            message (bytes): The signing digest of the Input.
+            key_pairs (:class:`~transactions.common.crypto.Keyring`): The keys
+                to sign the Transaction with.
         """
-        input_ = deepcopy(input_)
-        sha3_message = sha3_256(message.encode())
-        if input_.fulfills:
-            sha3_message.update("{}{}".format(input_.fulfills.txid, input_.fulfills.output).encode())
+        input_ = cls._copy_input(input_)
 
         for owner_before in set(input_.owners_before):
             # TODO: CC should throw a KeypairMismatchException, instead of
@@ -514,9 +799,7 @@ class Transaction(object):
                 raise KeypairMismatchException(
                     "Public key {} cannot be found " "in the fulfillment".format(owner_before)
                 )
-            try:
-                private_key = key_pairs[owner_before]
-            except KeyError:
+            if owner_before not in key_pairs:
                 raise KeypairMismatchException(
                     "Public key {} is not a pair " "to any of the private keys".format(owner_before)
                 )
@@ -524,7 +807,7 @@ class Transaction(object):
             # cryptoconditions makes no assumptions of the encoding of the
             # message to sign or verify. It only accepts bytestrings
             for subffill in subffills:
-                subffill.sign(sha3_message.digest(), base58.b58decode(private_key.encode()))
+                Transaction._sign_fulfillment(subffill, key_pairs, owner_before, message)
         return input_
 
     def inputs_valid(self, outputs: Output = None) -> bool:
@@ -543,22 +826,56 @@ class Transaction(object):
 
             Returns:
                 bool: If all Inputs are valid.
+
+            Raises:
+                InvalidScript: If the script of a Transaction loaded with
+                    `SCRIPT_DEFERRED` validation is not valid.
+        """
+        if not self._script_validated:
+            self.validate_script()
+        return self._inputs_valid(self._output_condition_uris(outputs))
+
+    def validate_script(self) -> bool:
+        """Validates the script of the Transaction, regardless of the
+        `script_validation` policy it was created with.
+
+        Returns:
+            bool: True if the Transaction has no script or a valid one.
+
+        Raises:
+            InvalidScript: If the script is not valid.
+        """
+        if self.script is not None and not self.script.validate():
+            raise InvalidScript("`script` input to output validation failed")
+        self._script_validated = True
+        return True
+
+    def _output_condition_uris(self, outputs: Optional[list[Output]] = None) -> list[str]:
+        """Returns the condition URIs the Inputs of this Transaction have to
+        fulfill.
+
+        Args:
+            outputs (:obj:`list` of :class:`~transactions.common.
+                transaction.Output`): The Outputs spent by this Transaction.
+
+        Returns:
+            :obj:`list` of :obj:`str`: One condition URI per Input.
         """
         if self.operation == self.CREATE:
             # NOTE: Since in the case of a `CREATE`-transaction we do not have
             #       to check for outputs, we're just submitting dummy
             #       values to the actual method. This simplifies it's logic
             #       greatly, as we do not have to check against `None` values.
-            return self._inputs_valid(["dummyvalue" for _ in self.inputs])
+            return ["dummyvalue" for _ in self.inputs]
         elif self.operation in [self.TRANSFER, self.COMPOSE, self.DECOMPOSE]:
             conditions = []
             for i in range(len(outputs)):
-                conditions.append(outputs[i].fulfillment.condition_uri)
-            return self._inputs_valid(conditions)
+                conditions.append(outputs[i].condition_uri)
+            return conditions
         elif self.operation == self.VALIDATOR_ELECTION:
-            return self._inputs_valid(["dummyvalue" for _ in self.inputs])
+            return ["dummyvalue" for _ in self.inputs]
         elif self.operation == self.CHAIN_MIGRATION_ELECTION:
-            return self._inputs_valid(["dummyvalue" for _ in self.inputs])
+            return ["dummyvalue" for _ in self.inputs]
         else:
             allowed_ops = ", ".join(self.__class__.ALLOWED_OPERATIONS)
             raise TypeError("`operation` must be one of {}".format(allowed_ops))
@@ -581,32 +898,31 @@ class Transaction(object):
         if len(self.inputs) != len(output_condition_uris):
             raise ValueError("Inputs and output_condition_uris must have the same count")
 
-        tx_dict = self.tx_dict if self.tx_dict else self.to_dict()
-        tx_dict = Transaction._remove_signatures(tx_dict)
-        tx_dict["id"] = None
-        tx_serialized = Transaction._to_str(tx_dict)
+        self._reset_signing_digest()
 
         def validate(i, output_condition_uri=None):
             """Validate input against output condition URI"""
-            return self._input_valid(self.inputs[i], self.operation, tx_serialized, output_condition_uri)
+            return self._input_valid(self.inputs[i], self.operation, self.signing_digest(i), output_condition_uri)
 
         return all(validate(i, cond) for i, cond in enumerate(output_condition_uris))
 
-    @lru_cache(maxsize=16384)
+    @timed("transaction.input_valid")
     def _input_valid(
-        self, input_: Input, operation: str, message: str, output_condition_uri: Optional[str] = None
+        self, input_: Input, operation: str, message: bytes, output_condition_uri: Optional[str] = None
     ) -> bool:
         """Validates a single Input against a single Output.
 
         Note:
             In case of a `CREATE` Transaction, this method
             does not validate against `output_condition_uri`.
+            Results of validating a fulfillment are memoized in
+            :data:`~transactions.common.memoize.verification_cache`.
 
         Args:
             input_ (:class:`~transactions.common.transaction.
                 Input`) The Input to be signed.
             operation (str): The type of Transaction.
-            message (str): The fulfillment message.
+            message (bytes): The signing digest of the Input.
             output_condition_uri (str, optional): An Output to check the
                 Input against.
 
@@ -615,7 +931,15 @@ class Transaction(object):
         """
         ccffill = input_.fulfillment
         try:
-            parsed_ffill = Fulfillment.from_uri(ccffill.serialize_uri())
+            ffill_uri = ccffill.serialize_uri()
+            cache_key = (ffill_uri, message)
+            ffill_valid = verification_cache.get(cache_key)
+            if ffill_valid is None:
+                count("transaction.verification.cache_misses")
+                with span("fulfillment.parse"):
+                    parsed_ffill = Fulfillment.from_uri(ffill_uri)
+            else:
+                count("transaction.verification.cache_hits")
         except TypeError as e:
             print(f"Exception TypeError : {e}")
             return False
@@ -636,20 +960,17 @@ class Transaction(object):
         else:
             output_valid = output_condition_uri == ccffill.condition_uri
 
-        ffill_valid = False
-        sha3_message = sha3_256(message.encode())
-        if input_.fulfills:
-            sha3_message.update("{}{}".format(input_.fulfills.txid, input_.fulfills.output).encode())
-
-        # NOTE: We pass a timestamp to `.validate`, as in case of a timeout
-        #       condition we'll have to validate against it
+        if ffill_valid is None:
+            # NOTE: We pass a timestamp to `.validate`, as in case of a timeout
+            #       condition we'll have to validate against it
 
-        # cryptoconditions makes no assumptions of the encoding of the
-        # message to sign or verify. It only accepts bytestrings
-        ffill_valid = parsed_ffill.validate(message=sha3_message.digest())
+            # cryptoconditions makes no assumptions of the encoding of the
+            # message to sign or verify. It only accepts bytestrings
+            with span("fulfillment.verify"):
+                ffill_valid = parsed_ffill.validate(message=message)
+            verification_cache.put(cache_key, ffill_valid)
         return output_valid and ffill_valid
 
-    # This function is required by `lru_cache` to create a key for memoization
     def __hash__(self):
         return hash(self.id)
 
@@ -660,9 +981,12 @@ class Transaction(object):
         Returns:
             dict: The Transaction as an alternative serialization format.
         """
+        return self._to_dict([input_.to_dict() for input_ in self.inputs])
+
+    def _to_dict(self, inputs: list[dict]) -> dict:
         asset_tag = Transaction.get_assets_tag(self.version)
         tx_dict = {
-            "inputs": [input_.to_dict() for input_ in self.inputs],
+            "inputs": inputs,
             "outputs": [output.to_dict() for output in self.outputs],
             "operation": str(self.operation),
             "metadata": self.metadata,
@@ -675,28 +999,23 @@ class Transaction(object):
             tx_dict["script"] = self.script.to_dict()
         return tx_dict
 
-    @staticmethod
-    # TODO: Remove `_dict` prefix of variable.
-    def _remove_signatures(tx_dict: dict) -> dict:
-        """Takes a Transaction dictionary and removes all signatures.
+    def to_frozen_dict(self) -> dict:
+        """Returns a read-only view of the Transaction's dictionary.
 
-        Args:
-            tx_dict (dict): The Transaction to remove all signatures from.
+        Note:
+            The view is memoized by the Transaction's id and shared between
+            all callers, so it must not be modified. Use :meth:`to_dict` to
+            get a mutable dictionary.
 
         Returns:
-            dict
-
-        """
-        # NOTE: We remove the reference since we need `tx_dict` only for the
-        #       transaction's hash
-        tx_dict = deepcopy(tx_dict)
-        for input_ in tx_dict["inputs"]:
-            # NOTE: Not all Cryptoconditions return a `signature` key (e.g.
-            #       ThresholdSha256), so setting it to `None` in any
-            #       case could yield incorrect signatures. This is why we only
-            #       set it to `None` if it's set in the dict.
-            input_["fulfillment"] = None
-        return tx_dict
+            :class:`~transactions.common.memoize.FrozenDict`
+        """
+        return memoized_frozen_dict(Transaction.to_dict.__wrapped__, self)
+
+    def _as_dict(self) -> dict:
+        # NOTE: Returns the memoized read-only dict if there is one, or else a
+        #       fresh dict. Either must not be modified.
+        return memoized_frozen_dict(Transaction.to_dict.__wrapped__, self, frozen=False)
 
     @staticmethod
     def _to_hash(value):
@@ -707,17 +1026,32 @@ class Transaction(object):
         return self._id
 
     def to_hash(self):
-        return self.to_dict()["id"]
+        return self._as_dict()["id"]
 
     @staticmethod
     def _to_str(value):
         return serialize(value)
 
-    # TODO: This method shouldn't call `_remove_signatures`
+    @staticmethod
+    def _to_canonical_str(tx: Union[dict, "Transaction"], strip_signatures: bool = True, strip_id: bool = False):
+        """Serializes a Transaction or Transaction dictionary without
+        copying it.
+
+        Args:
+            tx (dict|:class:`~transactions.common.transaction.Transaction`):
+                The Transaction to serialize.
+            strip_signatures (bool): Serialize all fulfillments as ``null``.
+            strip_id (bool): Serialize the id as ``null``.
+
+        Returns:
+            str
+        """
+        if isinstance(tx, Transaction):
+            tx = tx._as_dict()
+        return serialize_transaction(tx, strip_signatures=strip_signatures, strip_id=strip_id)
+
     def __str__(self):
-        _tx = self.to_dict()
-        tx = Transaction._remove_signatures(_tx)
-        return Transaction._to_str(tx)
+        return Transaction._to_canonical_str(self)
 
     @staticmethod
     def get_asset_ids(transactions: list):
@@ -770,24 +1104,19 @@ class Transaction(object):
         return asset_ids.pop()
 
     @staticmethod
+    @timed("transaction.validate_id")
     def validate_id(tx_body: dict):
         """Validate the transaction ID of a transaction
 
         Args:
             tx_body (dict): The Transaction to be transformed.
         """
-        # NOTE: Remove reference to avoid side effects
-        tx_body = deepcopy(tx_body)
-        tx_body = rapidjson.loads(rapidjson.dumps(tx_body))
-
         try:
             proposed_tx_id = tx_body["id"]
         except KeyError:
             raise InvalidHash("No transaction id found!")
 
-        tx_body["id"] = None
-
-        tx_body_serialized = Transaction._to_str(tx_body)
+        tx_body_serialized = Transaction._to_canonical_str(tx_body, strip_signatures=False, strip_id=True)
         valid_tx_id = Transaction._to_hash(tx_body_serialized)
         if proposed_tx_id != valid_tx_id:
             err_msg = "The transaction's id '{}' isn't equal to the hash of its body, i.e. it's not valid."
@@ -795,12 +1124,25 @@ class Transaction(object):
         return True
 
     @classmethod
+    @timed("transaction.from_dict")
     @memoize_from_dict
-    def from_dict(cls, tx: dict, skip_schema_validation=True):
+    def from_dict(cls, tx: dict, skip_schema_validation=True, lazy=False, script_validation=SCRIPT_EAGER):
         """Transforms a Python dictionary to a Transaction object.
 
+        Note:
+            With `lazy`, the Inputs and Outputs are only built when they are
+            first accessed, so no fulfillments or conditions get parsed for
+            accessing e.g. the id, assets, `spent_outputs` or
+            `unspent_outputs`. `tx` backs the Transaction and must not be
+            modified.
+
         Args:
             tx_body (dict): The Transaction to be transformed.
+            skip_schema_validation (bool): Don't validate the schema and id.
+            lazy (bool): Defer building the Inputs and Outputs.
+            script_validation (str): When to validate the script, see
+                :class:`~.Transaction`. Use `SCRIPT_TRUSTED` to load
+                committed Transactions without executing their scripts.
 
         Returns:
             :class:`~transactions.common.transaction.Transaction`
@@ -842,11 +1184,14 @@ class Transaction(object):
             tx_object.validate_id(local_dict)
             tx_object.validate_schema(local_dict)
 
-        inputs = [Input.from_dict(input_) for input_ in tx["inputs"]]
-        outputs = [Output.from_dict(output) for output in tx["outputs"]]
+        if lazy:
+            inputs = outputs = None
+        else:
+            inputs = [Input.from_dict(input_) for input_ in tx["inputs"]]
+            outputs = [Output.from_dict(output) for output in tx["outputs"]]
         asset_obj = Transaction.get_asset_obj(tx)
         script_ = Script.from_dict(script_) if script_ else None
-        return tx_object(
+        transaction = tx_object(
             tx["operation"],
             asset_obj,
             inputs,
@@ -856,22 +1201,96 @@ class Transaction(object):
             hash_id=tx["id"],
             tx_dict=tx,
             script=script_,
+            script_validation=script_validation,
         )
+        if lazy:
+            transaction.inputs = transaction.outputs = None
+        return transaction
+
+    @classmethod
+    def from_json(cls, tx_json: Union[str, bytes], validate: bool = True, script_validation: str = SCRIPT_EAGER):
+        """Transforms a JSON document to a Transaction object.
+
+        Note:
+            With `validate`, the schema is validated against `tx_json` itself
+            rather than a re-serialization of the parsed transaction, and the
+            id is checked before any Inputs or Outputs are built. Unlike
+            :meth:`from_dict`, unknown top-level keys are rejected.
+
+        Args:
+            tx_json (str|bytes): The Transaction as JSON, e.g. as received
+                over the network.
+            validate (bool): Validate the schema and id of the Transaction.
+            script_validation (str): When to validate the script, see
+                :class:`~.Transaction`.
+
+        Returns:
+            :class:`~transactions.common.transaction.Transaction`
+
+        Raises:
+            SchemaValidationError: If `tx_json` is not a valid Transaction.
+                Without `validate`, only if it is malformed, e.g. misses
+                a key.
+            InvalidHash: If the id of the Transaction is not valid.
+            InvalidScript: If the script of the Transaction is validated
+                and not valid.
+        """
+        from transactions.common.exceptions import SchemaValidationError, ValidationError
+
+        if script_validation not in SCRIPT_VALIDATION_POLICIES:
+            raise ValueError("`script_validation` must be one of {}".format(", ".join(SCRIPT_VALIDATION_POLICIES)))
+
+        try:
+            tx = deserialize(tx_json)
+        except ValueError as exc:
+            raise SchemaValidationError("Transaction is not valid JSON: {}".format(exc)) from exc
+        if not isinstance(tx, dict):
+            raise SchemaValidationError("Transaction must be a JSON object.")
+
+        if validate:
+            tx_object = Transaction.resolve_class(tx.get("operation"))
+            if not tx_object:
+                raise SchemaValidationError("Operation type does not exist.")
+            tx_object.validate_schema(tx, tx_json)
+            tx_object.validate_id(tx)
+
+        # NOTE: Without validation, a malformed Transaction is only detected
+        #       while it is built, e.g. by a missing key
+        try:
+            return cls.from_dict(tx, script_validation=script_validation)
+        except ValidationError:
+            raise
+        except (KeyError, TypeError, ValueError) as exc:
+            raise SchemaValidationError("Transaction is malformed: {!r}".format(exc)) from exc
 
     type_registry: dict[type, type] = {}
 
     @staticmethod
-    def register_type(tx_type, tx_class):
+    def register_type(tx_type, tx_class, schemas: Optional[dict[str, list[dict]]] = None):
+        """Registers the implementation class of a transaction type.
+
+        Args:
+            tx_type (str): The operation of the transaction type.
+            tx_class (type): The class implementing the transaction type.
+            schemas (dict, optional): Maps transaction versions to the
+                schemas a transaction of `tx_type` must satisfy on top of the
+                common transaction schema.
+        """
         Transaction.type_registry[tx_type] = tx_class
+        for version, version_schemas in (schemas or {}).items():
+            register_transaction_schema(tx_type, version_schemas, version=version)
 
     @staticmethod
     def resolve_class(operation):
         """For the given `tx` based on the `operation` key return its implementation class"""
+        # NOTE: Operations parsed from untrusted JSON may be of any type
+        if not isinstance(operation, str):
+            return None
         return Transaction.type_registry.get(operation)
 
     @classmethod
-    def validate_schema(cls, tx):
-        validate_transaction_schema(tx)
+    def validate_schema(cls, tx, tx_json=None):
+        validate_transaction_schema(tx, tx_json)
 
     # NOTE: only used for CREATE transactions
     @classmethod
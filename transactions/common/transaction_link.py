@@ -16,6 +16,8 @@ class TransactionLink(object):
         `txid`.
     """
 
+    __slots__ = ("txid", "output")
+
     def __init__(self, txid: Optional[str] = None, output: Optional[int] = None):
         """Create an instance of a :class:`~.TransactionLink`.
 
@@ -38,8 +40,9 @@ class TransactionLink(object):
         return self.txid is not None and self.output is not None
 
     def __eq__(self, other):
-        # TODO: If `other !== TransactionLink` return `False`
-        return self.to_dict() == other.to_dict()
+        if not isinstance(other, TransactionLink):
+            return NotImplemented
+        return self.txid == other.txid and self.output == other.output
 
     def __hash__(self):
         return hash((self.txid, self.output))
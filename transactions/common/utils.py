@@ -14,6 +14,7 @@ from transactions.common.exceptions import ValidationError
 from planetmint_cryptoconditions import ThresholdSha256, Ed25519Sha256, Fulfillment
 from transactions.common.exceptions import ThresholdTooDeep
 from planetmint_cryptoconditions.exceptions import UnsupportedTypeError
+from planetmint_cryptoconditions.types.threshold import FULFILLMENT
 
 VALID_LANGUAGES = (
     "danish",
@@ -81,6 +82,96 @@ def serialize(data: dict) -> str:
     return rapidjson.dumps(data, skipkeys=False, ensure_ascii=False, sort_keys=True)
 
 
+def serialize_transaction(tx_dict: dict, strip_signatures: bool = True, strip_id: bool = False) -> str:
+    """Serialize a transaction dict into its canonical JSON form.
+
+    The signatures and the id are replaced by ``null`` while serializing,
+    `tx_dict` itself is left untouched. Only the top level of the
+    transaction and its inputs are copied (shallowly), so no copy of the
+    whole tree is ever made.
+
+    Args:
+        tx_dict (dict): transaction dict to serialize
+        strip_signatures (bool): whether to set the `fulfillment` of all
+            inputs to ``null``
+        strip_id (bool): whether to set the `id` to ``null``
+
+    Returns:
+        str: JSON formatted string
+
+    """
+    body = dict(tx_dict)
+    if strip_signatures:
+        body["inputs"] = [{**input_, "fulfillment": None} for input_ in tx_dict["inputs"]]
+    if strip_id:
+        body["id"] = None
+    return serialize(body)
+
+
+def serialize_transaction_fragments(tx_dict: dict) -> list[str]:
+    """Serialize a transaction dict into its canonical JSON form, split at
+    the fulfillments of its inputs.
+
+    The id is serialized as ``null``. Joining the fragments with ``"null"``
+    yields the same string as :func:`serialize_transaction` with stripped
+    signatures and id, :func:`splice_fulfillments` fills in the
+    fulfillments instead. So after signing, only the fulfillments have to be
+    serialized again.
+
+    Args:
+        tx_dict (dict): transaction dict to serialize
+
+    Returns:
+        list: one JSON fragment more than the transaction has inputs
+    """
+    fragments = []
+    current = []
+    for i, key in enumerate(sorted(tx_dict)):
+        current.append(("{" if i == 0 else ",") + serialize(key) + ":")
+        if key == "id":
+            current.append("null")
+        elif key == "inputs":
+            current.append("[")
+            for j, input_ in enumerate(tx_dict["inputs"]):
+                if j:
+                    current.append(",")
+                for k, input_key in enumerate(sorted({*input_, "fulfillment"})):
+                    current.append(("{" if k == 0 else ",") + serialize(input_key) + ":")
+                    if input_key == "fulfillment":
+                        fragments.append("".join(current))
+                        current = []
+                    else:
+                        current.append(serialize(input_[input_key]))
+                current.append("}")
+            current.append("]")
+        else:
+            current.append(serialize(tx_dict[key]))
+    current.append("}" if tx_dict else "{}")
+    fragments.append("".join(current))
+    return fragments
+
+
+def splice_fulfillments(fragments: list[str], fulfillments: list) -> str:
+    """Join the fragments of :func:`serialize_transaction_fragments` with
+    the serialized `fulfillments` of the inputs.
+
+    Args:
+        fragments (list): the fragments of a transaction dict
+        fulfillments (list): the fulfillment of every input, as in the
+            input's dict
+
+    Returns:
+        str: JSON formatted string
+    """
+    if len(fulfillments) != len(fragments) - 1:
+        raise ValueError("expected {} fulfillments, got {}".format(len(fragments) - 1, len(fulfillments)))
+    parts = [fragments[0]]
+    for fulfillment, fragment in zip(fulfillments, fragments[1:]):
+        parts.append(serialize(fulfillment))
+        parts.append(fragment)
+    return "".join(parts)
+
+
 def deserialize(data: str) -> dict:
     """Deserialize a JSON formatted string into a dict.
 
@@ -203,6 +294,48 @@ def _fulfillment_to_details(fulfillment: type[Fulfillment]) -> dict:
     raise UnsupportedTypeError(fulfillment.type_name)
 
 
+def _fulfillment_to_key(fulfillment: type[Fulfillment]) -> tuple:
+    """Encode the structure of a fulfillment's condition, i.e. its public keys
+    and thresholds, as a hashable key. Conditions with equal keys have equal
+    condition URIs.
+
+    Args:
+        fulfillment: Crypto-conditions Fulfillment object
+    """
+
+    if fulfillment.type_name == "ed25519-sha-256":
+        return ("ed25519-sha-256", fulfillment.public_key)
+
+    if fulfillment.type_name == "threshold-sha-256":
+        subconditions = tuple(_fulfillment_to_key(cond["body"]) for cond in fulfillment.subconditions)
+        return ("threshold-sha-256", fulfillment.threshold, subconditions)
+
+    raise UnsupportedTypeError(fulfillment.type_name)
+
+
+def _copy_fulfillment(fulfillment: type[Fulfillment]) -> type[Fulfillment]:
+    """Copy a fulfillment, including its signatures, without deep copying it
+
+    Args:
+        fulfillment: Crypto-conditions Fulfillment object
+    """
+
+    if fulfillment.type_name == "ed25519-sha-256":
+        return Ed25519Sha256(public_key=fulfillment.public_key, signature=fulfillment.signature)
+
+    if fulfillment.type_name == "threshold-sha-256":
+        threshold = ThresholdSha256(fulfillment.threshold)
+        # NOTE: Subconditions that are no fulfillments can't be signed and
+        #       are shared
+        threshold.subconditions = [
+            {**cond, "body": _copy_fulfillment(cond["body"])} if cond["type"] == FULFILLMENT else cond
+            for cond in fulfillment.subconditions
+        ]
+        return threshold
+
+    raise UnsupportedTypeError(fulfillment.type_name)
+
+
 def _fulfillment_from_details(data: dict, _depth: int = 0):
     """Load a fulfillment for a signing spec dictionary
 
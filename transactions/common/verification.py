@@ -0,0 +1,250 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# Planetmint and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+"""Batch and parallel verification of transactions.
+
+Attributes:
+    InvalidInput (namedtuple): Object describing an input that failed
+        validation within a batch.
+    ValidationResult (namedtuple): Object holding the outcome of validating
+        a single transaction with :func:`validate_many`.
+
+"""
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from planetmint_cryptoconditions import Ed25519Sha256, ThresholdSha256, Fulfillment
+from planetmint_cryptoconditions.types.threshold import FULFILLMENT
+
+from transactions.common.crypto import verify_ed25519_signatures
+from transactions.common.exceptions import InvalidSignature
+from transactions.common.transaction import Transaction
+from transactions.common.utils import serialize, deserialize
+from .output import Output
+
+InvalidInput = namedtuple(
+    "InvalidInput",
+    (
+        "transaction_index",
+        "transaction_id",
+        "input_index",
+        "reason",
+    ),
+)
+
+ValidationResult = namedtuple(
+    "ValidationResult",
+    (
+        "transaction_id",
+        "valid",
+        "error",
+    ),
+)
+
+INVALID_FULFILLMENT = "invalid fulfillment"
+CONDITION_MISMATCH = "condition mismatch"
+INVALID_SIGNATURE = "invalid signature"
+
+
+def _collect_signatures(fulfillment: Fulfillment, signatures: list) -> bool:
+    """Collects the (public key, signature) pairs of all Ed25519 leaves that
+    take part in validating `fulfillment`.
+
+    Note:
+        For threshold conditions only the subfulfillments that would be
+        serialized into the fulfillment URI, i.e. the cheapest `threshold`
+        ones, are collected. This mirrors what validating a fulfillment
+        parsed from its URI checks.
+
+    Args:
+        fulfillment (:class:`planetmint_cryptoconditions.Fulfillment`): The
+            fulfillment to collect the signatures from.
+        signatures (list): The list the pairs are appended to.
+
+    Returns:
+        bool: False if `fulfillment` can not possibly be valid.
+    """
+    if isinstance(fulfillment, Ed25519Sha256):
+        if fulfillment.public_key is None or fulfillment.signature is None:
+            return False
+        signatures.append((fulfillment.public_key, fulfillment.signature))
+        return True
+    if isinstance(fulfillment, ThresholdSha256):
+        subfulfillments = sorted(
+            (
+                subcondition["body"]
+                for subcondition in fulfillment.subconditions
+                if subcondition["type"] == FULFILLMENT
+            ),
+            key=lambda subfulfillment: subfulfillment.calculate_cost(),
+        )
+        if fulfillment.threshold is None or len(subfulfillments) < fulfillment.threshold:
+            return False
+        return all(_collect_signatures(sub, signatures) for sub in subfulfillments[: fulfillment.threshold])
+    return False
+
+
+class BatchVerifier(object):
+    """Verifies the Inputs of many Transactions at once.
+
+    All Ed25519 signatures, including the ones nested in ThresholdSha256
+    fulfillments, are collected first and then checked in a single pass by
+    :func:`~transactions.common.crypto.verify_ed25519_signatures`.
+    """
+
+    def __init__(self):
+        self._transactions = []
+        self._failures = {}
+        # NOTE: (transaction index, input index) for every collected signature
+        self._owners = []
+        self._checks = []
+
+    def __len__(self):
+        return len(self._transactions)
+
+    def add(self, tx, outputs: Optional[list[Output]] = None) -> int:
+        """Adds a Transaction to the batch.
+
+        Args:
+            tx (:class:`~transactions.common.transaction.Transaction`): The
+                Transaction to verify.
+            outputs (:obj:`list` of :class:`~transactions.common.
+                transaction.Output`): The Outputs spent by `tx`, same as for
+                :meth:`~transactions.common.transaction.Transaction.inputs_valid`.
+
+        Returns:
+            int: The index of `tx` within the batch.
+
+        Raises:
+            ValueError: If the number of `outputs` doesn't match the number
+                of Inputs, or if the deferred script of `tx` is not valid.
+        """
+        if not tx._script_validated:
+            tx.validate_script()
+        condition_uris = tx._output_condition_uris(outputs)
+        if len(tx.inputs) != len(condition_uris):
+            raise ValueError("Inputs and output_condition_uris must have the same count")
+
+        tx_index = len(self._transactions)
+        self._transactions.append(tx)
+        skip_condition = tx.operation in [tx.CREATE, tx.CHAIN_MIGRATION_ELECTION, tx.VALIDATOR_ELECTION]
+        tx._reset_signing_digest()
+
+        for input_index, (input_, condition_uri) in enumerate(zip(tx.inputs, condition_uris)):
+            signatures = []
+            if not _collect_signatures(input_.fulfillment, signatures):
+                self._failures[(tx_index, input_index)] = INVALID_FULFILLMENT
+                continue
+            if not skip_condition and condition_uri != input_.fulfillment.condition_uri:
+                self._failures[(tx_index, input_index)] = CONDITION_MISMATCH
+                continue
+
+            digest = tx.signing_digest(input_index)
+            for public_key, signature in signatures:
+                self._owners.append((tx_index, input_index))
+                self._checks.append((public_key, digest, signature))
+        return tx_index
+
+    def verify(self) -> list[InvalidInput]:
+        """Verifies all signatures collected so far.
+
+        Returns:
+            :obj:`list` of :class:`~.InvalidInput`: The Inputs that are not
+            valid, ordered by transaction and input index. An empty list
+            means every Transaction in the batch is valid.
+        """
+        failures = dict(self._failures)
+        for owner, valid in zip(self._owners, verify_ed25519_signatures(self._checks)):
+            if not valid:
+                failures.setdefault(owner, INVALID_SIGNATURE)
+        return [
+            InvalidInput(tx_index, self._transactions[tx_index].id, input_index, reason)
+            for (tx_index, input_index), reason in sorted(failures.items())
+        ]
+
+
+def verify_transactions(transactions: list, outputs: Optional[list[Optional[list[Output]]]] = None):
+    """Verifies the Inputs of many Transactions in one batch.
+
+    Args:
+        transactions (:obj:`list` of :class:`~transactions.common.
+            transaction.Transaction`): The Transactions to verify.
+        outputs (:obj:`list`, optional): For every Transaction the list of
+            Outputs it spends, or None for Transactions that don't spend
+            any (e.g. `CREATE`).
+
+    Returns:
+        :obj:`list` of :class:`~.InvalidInput`: The Inputs that are not valid.
+    """
+    if outputs is None:
+        outputs = [None] * len(transactions)
+    if len(transactions) != len(outputs):
+        raise ValueError("`transactions` and `outputs` must have the same length")
+
+    verifier = BatchVerifier()
+    for tx, spent_outputs in zip(transactions, outputs):
+        verifier.add(tx, spent_outputs)
+    return verifier.verify()
+
+
+def _validate_serialized(payload: str) -> ValidationResult:
+    """Validates a single serialized `[tx, outputs]` pair. Runs in the
+    worker processes of :func:`validate_many`.
+    """
+    tx_dict, outputs = deserialize(payload)
+    try:
+        tx = Transaction.from_dict(tx_dict, skip_schema_validation=False)
+        if outputs is not None:
+            outputs = [Output.from_dict(output) for output in outputs]
+        if not tx.inputs_valid(outputs):
+            raise InvalidSignature("Transaction signature is invalid.")
+    except Exception as exc:
+        return ValidationResult(tx_dict.get("id"), False, exc.__class__)
+    return ValidationResult(tx_dict.get("id"), True, None)
+
+
+def validate_many(
+    tx_dicts: list[dict],
+    workers: Optional[int] = None,
+    outputs: Optional[list[Optional[list[dict]]]] = None,
+    chunksize: int = 16,
+) -> list[ValidationResult]:
+    """Validates many transactions on all cores.
+
+    Every transaction goes through :meth:`~transactions.common.transaction.
+    Transaction.from_dict` with schema and id validation enabled, followed by
+    :meth:`~transactions.common.transaction.Transaction.inputs_valid`. The
+    work is fanned out over a :class:`concurrent.futures.ProcessPoolExecutor`
+    and the transactions are shipped to the workers as serialized JSON.
+
+    Args:
+        tx_dicts (:obj:`list` of :obj:`dict`): The transactions to validate.
+        workers (int, optional): Number of worker processes. Defaults to the
+            number of CPUs. With a single worker, the transactions are
+            validated in the calling process.
+        outputs (:obj:`list`, optional): For every transaction the list of
+            output dicts it spends, or None for transactions that don't
+            spend any (e.g. `CREATE`).
+        chunksize (int): Number of transactions sent to a worker at once.
+
+    Returns:
+        :obj:`list` of :class:`~.ValidationResult`: One result per
+        transaction, in the order of `tx_dicts`. `error` holds the class of
+        the exception that made a transaction invalid.
+    """
+    if outputs is None:
+        outputs = [None] * len(tx_dicts)
+    if len(tx_dicts) != len(outputs):
+        raise ValueError("`tx_dicts` and `outputs` must have the same length")
+
+    workers = workers or os.cpu_count() or 1
+    payloads = [serialize([tx_dict, spent_outputs]) for tx_dict, spent_outputs in zip(tx_dicts, outputs)]
+    if workers == 1 or len(payloads) <= 1:
+        return [_validate_serialized(payload) for payload in payloads]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_validate_serialized, payloads, chunksize=chunksize))
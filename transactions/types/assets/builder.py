@@ -0,0 +1,149 @@
+# Copyright © 2020 Interplanetary Database Association e.V.,
+# Planetmint and IPDB software contributors.
+# SPDX-License-Identifier: (Apache-2.0 AND CC-BY-4.0)
+# Code is Apache-2.0 and docs are CC-BY-4.0
+
+from typing import Iterable, Iterator, Optional, Union
+
+from transactions.common.crypto import Keyring
+from transactions.common.transaction import Transaction
+from transactions.common.input import Input
+from transactions.common.output import Output
+from transactions.types.assets.create import Create
+from transactions.types.assets.transfer import Transfer
+
+
+def _template_key(public_keys) -> tuple:
+    # NOTE: `public_keys` may be nested to describe threshold conditions
+    return tuple(_template_key(key) if isinstance(key, list) else key for key in public_keys)
+
+
+# NOTE: Streamed Transactions are built once and handed out, memoizing their
+#       dicts would only fill the `to_dict` cache
+_to_dict = Transaction.to_dict.__wrapped__
+
+
+class TransactionBuilder(object):
+    """Builds and signs many `CREATE` and `TRANSFER` Transactions.
+
+    The private keys are decoded once for all Transactions and the Outputs
+    for recurring recipients are built from shared templates, so no
+    condition is built twice for the same set of public keys.
+
+    Note:
+        The fulfillments of the templates are shared between the Outputs
+        (and the `CREATE` Inputs) of all Transactions built. They are never
+        signed in place, as signing always copies the Input first, but they
+        must not be modified by the caller.
+    """
+
+    def __init__(self, private_keys: Union[list[str], Keyring]):
+        """Create a :class:`~.TransactionBuilder`.
+
+        Args:
+            private_keys (:obj:`list` of :obj:`str`|:class:`~transactions.
+                common.crypto.Keyring`): All private keys needed to sign the
+                Transactions that will be built.
+        """
+        if isinstance(private_keys, Keyring):
+            self._key_pairs = private_keys
+        elif isinstance(private_keys, list):
+            self._key_pairs = Keyring(private_keys)
+        else:
+            raise TypeError("`private_keys` must be a list instance")
+        self._templates = {}
+
+    def output(self, public_keys: list, amount: int) -> Output:
+        """Generates an Output like :meth:`~transactions.common.output.
+        Output.generate` does, reusing the condition of earlier Outputs with
+        the same `public_keys`.
+        """
+        key = _template_key(public_keys)
+        template = self._templates.get(key)
+        if template is None:
+            template = self._templates[key] = Output.generate(public_keys, 1)
+        return Output(template.fulfillment, public_keys, amount)
+
+    def _outputs(self, recipients: list[tuple[list[str], int]]) -> list[Output]:
+        if not isinstance(recipients, list):
+            raise TypeError("`recipients` must be a list instance")
+        if len(recipients) == 0:
+            raise ValueError("`recipients` list cannot be empty")
+
+        outputs = []
+        for recipient in recipients:
+            if not isinstance(recipient, tuple) or len(recipient) != 2:
+                raise ValueError(
+                    ("Each `recipient` in the list must be a tuple of `([<list of public keys>], <amount>)`")
+                )
+            pub_keys, amount = recipient
+            outputs.append(self.output(pub_keys, amount))
+        return outputs
+
+    def create(
+        self,
+        tx_signers: list[str],
+        recipients: list[tuple[list[str], int]],
+        metadata: Optional[str] = None,
+        assets: Optional[list] = [{"data": None}],
+    ) -> Create:
+        """Builds a signed `CREATE` Transaction, see :meth:`~transactions.
+        types.assets.create.Create.generate`.
+        """
+        Create.validate_create(tx_signers, recipients, assets, metadata)
+        outputs = self._outputs(recipients)
+        inputs = [Input(self.output(tx_signers, 1).fulfillment, tx_signers)]
+        tx = Create(Create.OPERATION, assets, inputs, outputs, metadata)
+        return tx._sign_with_key_pairs(self._key_pairs)
+
+    def transfer(
+        self,
+        inputs: list[Input],
+        recipients: list[tuple[list[str], int]],
+        asset_ids: list[str],
+        metadata: Optional[str] = None,
+    ) -> Transfer:
+        """Builds a signed `TRANSFER` Transaction, see :meth:`~transactions.
+        types.assets.transfer.Transfer.generate`.
+
+        Note:
+            Unlike :meth:`~transactions.types.assets.transfer.Transfer.
+            generate`, `inputs` are not copied up front. Signing replaces
+            them with signed copies, so the passed Inputs stay untouched.
+        """
+        if not isinstance(inputs, list):
+            raise TypeError("`inputs` must be a list instance")
+        if len(inputs) == 0:
+            raise ValueError("`inputs` must contain at least one item")
+        outputs = self._outputs(recipients)
+        if not isinstance(asset_ids, list):
+            raise TypeError("`asset_ids` must be a list of strings")
+
+        tx = Transfer(Transfer.OPERATION, [{"id": id} for id in asset_ids], list(inputs), outputs, metadata)
+        return tx._sign_with_key_pairs(self._key_pairs)
+
+    def create_many(self, specs: Iterable[dict]) -> Iterator[dict]:
+        """Builds and signs a `CREATE` Transaction for each of `specs`.
+
+        Args:
+            specs (iterable): The keyword arguments of :meth:`create` for
+                each Transaction. Can be a generator, it is consumed lazily.
+
+        Yields:
+            dict: The signed Transactions.
+        """
+        for spec in specs:
+            yield _to_dict(self.create(**spec))
+
+    def transfer_many(self, specs: Iterable[dict]) -> Iterator[dict]:
+        """Builds and signs a `TRANSFER` Transaction for each of `specs`.
+
+        Args:
+            specs (iterable): The keyword arguments of :meth:`transfer` for
+                each Transaction. Can be a generator, it is consumed lazily.
+
+        Yields:
+            dict: The signed Transactions.
+        """
+        for spec in specs:
+            yield _to_dict(self.transfer(**spec))
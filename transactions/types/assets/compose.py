@@ -50,8 +50,8 @@ class Compose(Transaction):
         return (deepcopy(inputs), outputs)
 
     @classmethod
-    def validate_schema(cls, tx):
-        validate_transaction_schema(tx)
+    def validate_schema(cls, tx, tx_json=None):
+        validate_transaction_schema(tx, tx_json)
 
     @classmethod
     def generate(
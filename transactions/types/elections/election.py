@@ -64,11 +64,11 @@ class Election(Transaction):
         return election
 
     @classmethod
-    def validate_schema(cls, tx):
+    def validate_schema(cls, tx, tx_json=None):
         """Validate the election transaction. Since `ELECTION` extends `CREATE` transaction, all the validations for
         `CREATE` transaction should be inherited
         """
         try:
-            validate_transaction_schema(tx)
+            validate_transaction_schema(tx, tx_json)
         except KeyError:
             raise SchemaValidationError()
@@ -14,8 +14,8 @@ class ValidatorElection(Election):
     ALLOWED_OPERATIONS = (OPERATION,)
 
     @classmethod
-    def validate_schema(cls, tx):
-        super(ValidatorElection, cls).validate_schema(tx)
+    def validate_schema(cls, tx, tx_json=None):
+        super(ValidatorElection, cls).validate_schema(tx, tx_json)
         pub_key = (
             tx["assets"][0]["data"]["public_key"] if tx["version"] == "3.0" else tx["asset"]["data"]["public_key"]
         )
@@ -24,11 +24,11 @@ class Vote(Transfer):
         return election_vote
 
     @classmethod
-    def validate_schema(cls, tx):
+    def validate_schema(cls, tx, tx_json=None):
         """Validate the validator election vote transaction. Since `VOTE` extends `TRANSFER`
         transaction, all the validations for `CREATE` transaction should be inherited
         """
         try:
-            validate_transaction_schema(tx)
+            validate_transaction_schema(tx, tx_json)
         except KeyError:
             raise SchemaValidationError()